@@ -1,13 +1,133 @@
 import asyncio
+import heapq
+import json
 import logging
+import sys
 from dataclasses import dataclass
 from itertools import groupby
 from operator import attrgetter
 from typing import Dict, List, Any, Optional
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    _NUMBA_AVAILABLE = False
+
 from sources import ADAPTERS, RawRaceDocument
 from normalizer import NormalizedRace, normalize_race_docs
 
+if np is not None:
+    # The piecewise-constant score bands from the _get_*_score methods as
+    # bin edges plus value tables, so the batch path can resolve a whole
+    # column of races with one searchsorted instead of a branch cascade
+    # per race. Edges use side="right" semantics: value < first edge maps
+    # to index 0.
+    _FS_EDGES = np.array([3.0, 5.0, 8.0, 11.0, 13.0])
+    _FS_VALUES = np.array([20.0, 60.0, 100.0, 80.0, 40.0, 20.0])
+    _FAV_EDGES = np.array([1.5, 2.5, 4.0, 6.0])
+    _FAV_VALUES = np.array([60.0, 100.0, 80.0, 50.0, 30.0])
+
+if np is not None and _NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _score_kernel(field_size, fav, sec, avg, n_odds, w_fs, w_fav, w_spread, w_ratio):
+        """
+        Compiled inner loop of the batch scorer: the same band cascades as
+        the scalar methods, lowered by LLVM to branch chains over machine
+        floats. fastmath stays off so the weighted sum keeps the exact
+        evaluation order of the Python path and rounding matches.
+        """
+        n = field_size.shape[0]
+        fs_score = np.empty(n)
+        fav_score = np.empty(n)
+        spread = np.empty(n)
+        spread_score = np.empty(n)
+        ratio = np.empty(n)
+        ratio_score = np.empty(n)
+        total = np.empty(n)
+        for i in range(n):
+            f = field_size[i]
+            if f < 3.0:
+                s_fs = 20.0
+            elif f < 5.0:
+                s_fs = 60.0
+            elif f < 8.0:
+                s_fs = 100.0
+            elif f < 11.0:
+                s_fs = 80.0
+            elif f < 13.0:
+                s_fs = 40.0
+            else:
+                s_fs = 20.0
+            fo = fav[i]
+            if fo < 1.5:
+                s_fav = 60.0
+            elif fo < 2.5:
+                s_fav = 100.0
+            elif fo < 4.0:
+                s_fav = 80.0
+            elif fo < 6.0:
+                s_fav = 50.0
+            else:
+                s_fav = 30.0
+            sp = sec[i] - fo
+            if sp > 2.0:
+                s_sp = 100.0
+            elif sp > 1.0:
+                s_sp = 80.0
+            elif sp >= 0.5:
+                s_sp = 50.0
+            else:
+                s_sp = 30.0
+            if n_odds[i] < 3:
+                rt = 0.0
+                s_rt = 20.0
+            elif avg[i] == 0.0:
+                rt = 0.0
+                s_rt = 0.0
+            else:
+                rt = fo / avg[i]
+                if rt >= 0.8:
+                    s_rt = 100.0
+                elif rt >= 0.7:
+                    s_rt = 90.0
+                elif rt >= 0.5:
+                    s_rt = 70.0
+                elif rt >= 0.3:
+                    s_rt = 50.0
+                else:
+                    s_rt = 40.0
+            fs_score[i] = s_fs
+            fav_score[i] = s_fav
+            spread[i] = sp
+            spread_score[i] = s_sp
+            ratio[i] = rt
+            ratio_score[i] = s_rt
+            total[i] = s_fs * w_fs + s_fav * w_fav + s_sp * w_spread + s_rt * w_ratio
+        return total, fs_score, fav_score, spread, spread_score, ratio, ratio_score
+
+    # Warm the JIT with a one-element batch so the first real scoring call
+    # pays no compile latency (cache=True makes reruns hit the disk cache).
+    _score_kernel(
+        np.zeros(1),
+        np.zeros(1),
+        np.zeros(1),
+        np.zeros(1),
+        np.zeros(1, dtype=np.intp),
+        0.0,
+        0.0,
+        0.0,
+        0.0,
+    )
+
 # --- Data Structures ---
 
 
@@ -23,20 +143,37 @@ class ScoreResult:
 # --- Pipeline Steps ---
 
 
+# Enabled adapter instances from the previous pipeline run, keyed by a
+# fingerprint of the config they were built from. Persistent modes call
+# collect_all once per tick with the same config, so re-instantiating
+# (and re-filtering) every registered adapter each time is wasted work;
+# a config change simply misses and rebuilds.
+_adapter_cache: Dict[str, List[Any]] = {}
+
+
+def _enabled_adapters(config: Dict[str, Any]) -> List[Any]:
+    key = json.dumps(config, sort_keys=True, default=str)
+    cached = _adapter_cache.get(key)
+    if cached is None:
+        adapters = [adapter(config) for adapter in ADAPTERS]
+        # Filter out adapters that were disabled during initialization
+        cached = [
+            adapter
+            for adapter in adapters
+            if hasattr(adapter, "site_config") and adapter.site_config is not None
+        ]
+        _adapter_cache.clear()
+        _adapter_cache[key] = cached
+    return cached
+
+
 async def collect_all(config: Dict[str, Any]) -> List[RawRaceDocument]:
     """
     Instantiates and runs all registered source adapters concurrently.
     """
     logging.info(f"Found {len(ADAPTERS)} registered adapters.")
 
-    adapters = [adapter(config) for adapter in ADAPTERS]
-
-    # Filter out adapters that were disabled during initialization
-    enabled_adapters = [
-        adapter
-        for adapter in adapters
-        if hasattr(adapter, "site_config") and adapter.site_config is not None
-    ]
+    enabled_adapters = _enabled_adapters(config)
 
     if not enabled_adapters:
         logging.warning("No enabled adapters found in the configuration.")
@@ -44,14 +181,20 @@ async def collect_all(config: Dict[str, Any]) -> List[RawRaceDocument]:
 
     logging.info(f"Running {len(enabled_adapters)} enabled adapters.")
     tasks = [adapter.fetch() for adapter in enabled_adapters]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
 
+    # Fold results in completion order instead of gather-and-wait: fast
+    # adapters are merged while slow ones are still in flight, and each
+    # failure is handled where it is raised rather than through the
+    # exception-in-result-list isinstance dance.
     all_docs = []
-    for res in results:
-        if isinstance(res, list):
-            all_docs.extend(res)
-        elif isinstance(res, Exception):
-            logging.error(f"Adapter failed to fetch: {res}", exc_info=res)
+    for future in asyncio.as_completed(tasks):
+        try:
+            docs = await future
+        except Exception as e:
+            logging.error(f"Adapter failed to fetch: {e}", exc_info=e)
+            continue
+        if docs:
+            all_docs.extend(docs)
 
     logging.info(f"Collected {len(all_docs)} raw race documents from all sources.")
     return all_docs
@@ -125,6 +268,15 @@ class V2Scorer:
         else:
             self.weights = {key: value / total_weight for key, value in scorer_weights.items()}
 
+        # Weight tuple in scoring order, so the hot paths unpack once per
+        # call instead of indexing the dict four times per race.
+        self._w = (
+            self.weights["FIELD_SIZE"],
+            self.weights["FAVORITE_ODDS"],
+            self.weights["ODDS_SPREAD"],
+            self.weights["VALUE_VS_SP"],
+        )
+
         logging.info(f"V2Scorer initialized with weights: {self.weights}")
 
     def _get_field_size_score(self, field_size: int) -> float:
@@ -201,17 +353,19 @@ class V2Scorer:
     def score_race(self, race: NormalizedRace) -> ScoreResult:
         """Calculates a score for a single normalized race."""
 
-        runners_with_odds = sorted(
-            [r for r in race.runners if r.odds_decimal is not None], key=lambda r: r.odds_decimal
-        )
+        runners_with_odds = [r for r in race.runners if r.odds_decimal is not None]
 
         if len(runners_with_odds) < 2:
             return ScoreResult(
                 race=race, score=0.0, reason="Not enough runners with odds to score."
             )
 
-        favorite = runners_with_odds[0]
-        second_favorite = runners_with_odds[1]
+        # Only the two shortest-priced runners matter here; a partial
+        # selection is O(n) versus a full O(n log n) sort, and the ratio
+        # scorer sorts its own filtered copy anyway.
+        favorite, second_favorite = heapq.nsmallest(
+            2, runners_with_odds, key=attrgetter("odds_decimal")
+        )
 
         fav_odds = favorite.odds_decimal
         sec_fav_odds = second_favorite.odds_decimal
@@ -225,11 +379,12 @@ class V2Scorer:
 
         # Calculate final weighted score
         # Note: The weight key "VALUE_VS_SP" is kept for config compatibility
+        w_fs, w_fav, w_spread, w_ratio = self._w
         final_score = (
-            (field_size_score * self.weights["FIELD_SIZE"])
-            + (fav_odds_score * self.weights["FAVORITE_ODDS"])
-            + (spread_score * self.weights["ODDS_SPREAD"])
-            + (fav_ratio_score * self.weights["VALUE_VS_SP"])
+            (field_size_score * w_fs)
+            + (fav_odds_score * w_fav)
+            + (spread_score * w_spread)
+            + (fav_ratio_score * w_ratio)
         )
 
         reason = (
@@ -241,13 +396,101 @@ class V2Scorer:
 
         return ScoreResult(race=race, score=round(final_score, 2), reason=reason)
 
+    def score_batch(self, races: List[NormalizedRace]) -> List[ScoreResult]:
+        """
+        Scores many races at once. Vectorized over struct-of-arrays columns
+        when NumPy is available; otherwise falls back to per-race scoring.
+        """
+        if np is not None:
+            return _score_batch(self, races)
+        return [self.score_race(race) for race in races]
+
+
+def _score_batch(scorer: V2Scorer, races: List[NormalizedRace]) -> List[ScoreResult]:
+    """
+    Vectorized twin of V2Scorer.score_race: a Python prepass extracts the
+    per-race favourite/second/average odds columns, NumPy resolves all four
+    subscores table-wise, and a final loop formats the reason strings. The
+    arithmetic mirrors the scalar path exactly so rounding matches.
+    """
+    n = len(races)
+    field_size = np.zeros(n)
+    fav = np.zeros(n)
+    sec = np.zeros(n)
+    avg = np.zeros(n)
+    n_odds = np.zeros(n, dtype=np.intp)
+
+    for i, race in enumerate(races):
+        odds = [r.odds_decimal for r in race.runners if r.odds_decimal is not None]
+        field_size[i] = len(race.runners)
+        k = len(odds)
+        n_odds[i] = k
+        if k >= 2:
+            odds.sort()
+            fav[i] = odds[0]
+            sec[i] = odds[1]
+            avg[i] = sum(odds) / k
+
+    w_fs, w_fav, w_spread, w_ratio = scorer._w
+    if _NUMBA_AVAILABLE:
+        total, fs_score, fav_score, spread, spread_score, ratio, ratio_score = _score_kernel(
+            field_size,
+            fav,
+            sec,
+            avg,
+            n_odds,
+            w_fs,
+            w_fav,
+            w_spread,
+            w_ratio,
+        )
+    else:
+        fs_score = _FS_VALUES[np.searchsorted(_FS_EDGES, field_size, side="right")]
+        fav_score = _FAV_VALUES[np.searchsorted(_FAV_EDGES, fav, side="right")]
+        spread = sec - fav
+        # Spread and ratio bands mix open and closed boundaries, so they
+        # stay as condition stacks rather than searchsorted tables.
+        spread_score = np.select(
+            [spread > 2.0, spread > 1.0, spread >= 0.5], [100.0, 80.0, 50.0], 30.0
+        )
+        ratio = np.divide(fav, avg, out=np.zeros(n), where=avg != 0)
+        ratio_score = np.select(
+            [ratio >= 0.8, ratio >= 0.7, ratio >= 0.5, ratio >= 0.3],
+            [100.0, 90.0, 70.0, 50.0],
+            40.0,
+        )
+        few = n_odds < 3
+        ratio_score[few] = 20.0
+        ratio[few] = 0.0
+        ratio_score[(~few) & (avg == 0)] = 0.0
+
+        total = (
+            fs_score * w_fs + fav_score * w_fav + spread_score * w_spread + ratio_score * w_ratio
+        )
+
+    results = []
+    for i, race in enumerate(races):
+        if n_odds[i] < 2:
+            results.append(
+                ScoreResult(race=race, score=0.0, reason="Not enough runners with odds to score.")
+            )
+            continue
+        reason = (
+            f"Field Size: {int(field_size[i])} ({fs_score[i]:.0f}), "
+            f"Fav Odds: {fav[i]:.2f} ({fav_score[i]:.0f}), "
+            f"Spread: {spread[i]:.2f} ({spread_score[i]:.0f}), "
+            f"FavRatio: {ratio[i]:.2f}({ratio_score[i]:.0f})"
+        )
+        results.append(ScoreResult(race=race, score=round(float(total[i]), 2), reason=reason))
+    return results
+
 
 def score_races(races: List[NormalizedRace], config: Dict) -> List[ScoreResult]:
     """
     Scores a list of normalized races using the V2Scorer.
     """
     scorer = V2Scorer(config)
-    scored_races = [scorer.score_race(race) for race in races]
+    scored_races = scorer.score_batch(races)
 
     logging.info(f"Scored {len(scored_races)} races.")
     return sorted(scored_races, key=lambda r: r.score, reverse=True)
@@ -256,6 +499,12 @@ def score_races(races: List[NormalizedRace], config: Dict) -> List[ScoreResult]:
 # --- Reporting ---
 
 
+def _saddle_key(runner) -> int:
+    """Sort key for display: numeric saddle cloths in order, the rest last."""
+    sc = runner.saddle_cloth
+    return int(sc) if sc.isdigit() else 999
+
+
 def display_results_console(scored_results: List[ScoreResult]):
     """
     Displays the final scored results in a user-friendly format on the console.
@@ -265,22 +514,25 @@ def display_results_console(scored_results: List[ScoreResult]):
         print("No races to display.")
         return
 
-    print(f"Displaying top {len(scored_results)} scored races:")
+    # Buffer the whole report and emit it with one write: a print per line
+    # means a flush/syscall per line, which is visibly slow on remote or
+    # Windows consoles for a long result list.
+    lines = [f"Displaying top {len(scored_results)} scored races:"]
     for result in scored_results:
-        print("-" * 50)
-        print(f"Race: {result.race.race_key} (Score: {result.score})")
-        print(f"  Reason: {result.reason}")
-        print(f"  Start Time: {result.race.start_time_iso}")
-        print(f"  Sources: {', '.join(result.race.source_ids)}")
-        print(f"  Runners ({len(result.race.runners)}):")
+        lines.append("-" * 50)
+        lines.append(f"Race: {result.race.race_key} (Score: {result.score})")
+        lines.append(f"  Reason: {result.reason}")
+        lines.append(f"  Start Time: {result.race.start_time_iso}")
+        lines.append(f"  Sources: {', '.join(result.race.source_ids)}")
+        lines.append(f"  Runners ({len(result.race.runners)}):")
         # Sort runners by saddle cloth number for consistent display
-        sorted_runners = sorted(
-            result.race.runners,
-            key=lambda r: int(r.saddle_cloth) if r.saddle_cloth.isdigit() else 999,
+        sorted_runners = sorted(result.race.runners, key=_saddle_key)
+        lines.extend(
+            f"    - {r.saddle_cloth}. {r.name} "
+            f"({f'{r.odds_decimal:.2f}' if r.odds_decimal else 'N/A'})"
+            for r in sorted_runners
         )
-        for runner in sorted_runners:
-            odds = f"{runner.odds_decimal:.2f}" if runner.odds_decimal else "N/A"
-            print(f"    - {runner.saddle_cloth}. {runner.name} ({odds})")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # --- Main Pipeline Orchestrator ---
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import random
 import time
+from itertools import cycle
 import httpx
 from httpx import Cookies
 from typing import Optional, List, Dict
@@ -49,9 +50,15 @@ def _pick_proxy() -> Optional[str]:
     return None
 
 
+# Fingerprints are static config, so the rotation order is fixed at import:
+# a deterministic cycle spreads them evenly across requests and replaces a
+# random.choice call per request with a single iterator step.
+_FP_CYCLE = cycle(FP_LIST) if FP_LIST else None
+
+
 def _pick_fingerprint() -> Dict[str, str]:
-    if FEATURES.get("enable_fingerprint_rotation") and FP_LIST:
-        return random.choice(FP_LIST)
+    if FEATURES.get("enable_fingerprint_rotation") and _FP_CYCLE is not None:
+        return next(_FP_CYCLE)
     return {}
 
 
@@ -75,8 +82,17 @@ def get_shared_async_client(extra_headers: Dict[str, str] | None = None) -> http
             follow_redirects=bool(HTTP_CFG.get("follow_redirects", True)),
             http2=bool(HTTP_CFG.get("http2", True)),
             timeout=httpx.Timeout(15.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=HTTP_CFG.get("max_connections", 100),
+                max_keepalive_connections=HTTP_CFG.get("max_keepalive_connections", 20),
+                keepalive_expiry=HTTP_CFG.get("keepalive_expiry_sec", 30.0),
+            ),
             proxies=_pick_proxy(),
             headers=_base_headers(extra_headers),
+            # Connect-level retries happen inside the transport, so a flaky
+            # DNS lookup or TCP handshake is re-tried without burning one of
+            # resilient_get's application-level attempts.
+            transport=httpx.AsyncHTTPTransport(retries=HTTP_CFG.get("connect_retries", 1)),
         )
     return _shared_async_client
 
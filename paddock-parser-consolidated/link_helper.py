@@ -50,10 +50,12 @@ def create_and_launch_link_helper(config: Dict):
             all_categories.append({"title": category.get("title"), "sites": enabled_sites})
 
     # --- Dynamic HTML Generation ---
-    sections_html = ""
+    # Fragments are gathered in lists and joined once; repeated += on a
+    # growing string re-copies the whole accumulated document per site.
+    sections = []
     for category in all_categories:
         title = category.get("title", "Unknown Category")
-        sites_html = ""
+        site_fragments = []
         for site in category.get("sites", []):
             name = site.get("name", "Unnamed Link")
             # The URL might not have a format key, so handle that gracefully
@@ -63,7 +65,7 @@ def create_and_launch_link_helper(config: Dict):
 
             source_id = name.replace(" ", "_").replace("(", "").replace(")", "").replace("/", "_")
 
-            proxy_links_html = ""
+            proxy_fragments = []
             for viewer in proxy_viewers:
                 if viewer.get("ENABLED", False):
                     proxy_url_template = viewer.get("TOOL_URL", "")
@@ -71,11 +73,12 @@ def create_and_launch_link_helper(config: Dict):
                     if proxy_url_template:
                         encoded_url = quote(url, safe=":/")
                         proxy_full_url = proxy_url_template.format(target_url=encoded_url)
-                        proxy_links_html += (
+                        proxy_fragments.append(
                             f' | <a href="{proxy_full_url}" target="_blank">{proxy_link_text}</a>'
                         )
+            proxy_links_html = "".join(proxy_fragments)
 
-            sites_html += f"""
+            site_fragments.append(f"""
             <div class="source-item">
                 <div class="source-header">
                     <strong>{name}:</strong>
@@ -85,8 +88,10 @@ def create_and_launch_link_helper(config: Dict):
                 </div>
                 <textarea id="{source_id}" placeholder="Paste source code for {name} here..."></textarea>
             </div>
-            """
-        sections_html += f"<h2>{title}</h2>\n<div class='source-grid'>{sites_html}</div>\n"
+            """)
+        sites_html = "".join(site_fragments)
+        sections.append(f"<h2>{title}</h2>\n<div class='source-grid'>{sites_html}</div>\n")
+    sections_html = "".join(sections)
 
     html_content = f"""
 <!DOCTYPE html>
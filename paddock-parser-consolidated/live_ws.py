@@ -1,22 +1,53 @@
 # live_ws.py
 import asyncio
 import json
+import random
 import websockets
 from typing import List, Dict, Any
 
 
 async def ws_collect(
-    uri: str, subscribe_msg: Dict[str, Any] | None = None, duration_sec: int = 30
+    uri: str,
+    subscribe_msg: Dict[str, Any] | None = None,
+    duration_sec: int = 30,
+    idle_timeout_sec: float = 10.0,
 ) -> List[str]:
-    msgs = []
-    async with websockets.connect(uri, max_size=2**22) as ws:
-        if subscribe_msg:
-            await ws.send(json.dumps(subscribe_msg))
-        end = asyncio.get_event_loop().time() + duration_sec
-        while asyncio.get_event_loop().time() < end:
-            try:
-                msg = await asyncio.wait_for(ws.recv(), timeout=10)
-                msgs.append(msg)
-            except asyncio.TimeoutError:
+    """
+    Collects messages from a websocket for up to duration_sec. A dropped
+    connection no longer loses what was already collected: the outer loop
+    reconnects with exponential backoff plus jitter until the deadline,
+    resubscribing on each new connection. An idle gap of idle_timeout_sec
+    with no messages ends collection early, as before.
+    """
+    msgs: List[str] = []
+    loop = asyncio.get_event_loop()
+    end = loop.time() + duration_sec
+    backoff = 1.0
+    while loop.time() < end:
+        try:
+            async with websockets.connect(
+                uri, max_size=2**22, ping_interval=20, ping_timeout=20
+            ) as ws:
+                backoff = 1.0
+                if subscribe_msg:
+                    await ws.send(json.dumps(subscribe_msg))
+                while True:
+                    remaining = end - loop.time()
+                    if remaining <= 0:
+                        return msgs
+                    try:
+                        msg = await asyncio.wait_for(
+                            ws.recv(), timeout=min(idle_timeout_sec, remaining)
+                        )
+                    except asyncio.TimeoutError:
+                        return msgs
+                    msgs.append(msg)
+        except (OSError, websockets.WebSocketException):
+            remaining = end - loop.time()
+            if remaining <= 0:
                 break
+            # Jittered backoff so flapping endpoints aren't hammered in
+            # lockstep, capped by both a ceiling and the deadline.
+            await asyncio.sleep(min(backoff + random.random(), remaining))
+            backoff = min(backoff * 2, 60.0)
     return msgs
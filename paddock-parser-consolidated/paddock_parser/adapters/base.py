@@ -7,6 +7,9 @@ class BaseV2Adapter:
     """A base class for V2 adapters to share common logic."""
 
     source_id: str = "base_adapter"
+    # What the source serves: "html" adapters parse a DOM, "json" adapters
+    # decode the response body directly and never build a soup.
+    response_kind: str = "html"
 
     def __init__(self, config: dict):
         self.config = config
@@ -23,17 +26,20 @@ class BaseV2Adapter:
         site_config = data_sources_v2.get(self.source_id)
 
         if not site_config or not site_config.get("enabled", False):
-            logging.info(
-                f"Configuration for source_id '{self.source_id}' not found or not enabled in config.json."
+            logging.debug(
+                "Configuration for source_id '%s' not found or not enabled in config.json.",
+                self.source_id,
             )
             return None
 
-        # Add the base_url to the config for convenience, if not already present
+        # base_url is normally injected once at config load by the
+        # ConfigurationManager; the fallback covers hand-built config dicts
+        # that never passed through it.
         if "base_url" not in site_config and "url" in site_config:
             parsed_url = urlparse(site_config["url"])
             site_config["base_url"] = f"{parsed_url.scheme}://{parsed_url.netloc}"
 
-        logging.info(f"Found and enabled configuration for source_id: '{self.source_id}'")
+        logging.debug("Found and enabled configuration for source_id: '%s'", self.source_id)
         return site_config
 
     async def fetch(self) -> list[RawRaceDocument]:
@@ -78,7 +78,7 @@ class EquibaseAdapter(BaseAdapterV3):
         return []
 
     def _parse_race_list(self, html_content: str) -> list[str]:
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, "lxml")
         soup = remove_honeypot_links(soup)
         links = soup.select('a[href*="/static/entry/"][href*="USA-D.html"]')
 
@@ -96,7 +96,7 @@ class EquibaseAdapter(BaseAdapterV3):
         race, so runner information (jockeys, trainers) is not available here.
         """
         races = []
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, "lxml")
 
         track_name_elem = soup.find("h1", id="pageHeader")
         track_name = (
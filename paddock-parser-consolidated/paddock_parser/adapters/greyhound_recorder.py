@@ -51,7 +51,7 @@ class GreyhoundRecorderAdapter(BaseAdapterV3):
                 logging.error(f"[{self.source_id}] No response received from {target_url}")
                 return []
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, "lxml")
             soup = remove_honeypot_links(soup)
             return self._parse_races_from_html(soup)
         except Exception as e:
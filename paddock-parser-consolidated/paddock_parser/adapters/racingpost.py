@@ -50,7 +50,7 @@ class RacingPostAdapter(BaseAdapterV3):
                 logging.error(f"[{self.source_id}] No response received from {target_url}")
                 return []
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, "lxml")
             soup = remove_honeypot_links(soup)
             return self._parse_races_from_html(soup)
         except Exception as e:
@@ -153,7 +153,7 @@ class RacingPostAdapter(BaseAdapterV3):
         """
         Parses the HTML content and returns a list of fully normalized races.
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, "lxml")
         raw_races = self._parse_races_from_html(soup)
 
         normalized_races = [normalize_race_docs(raw_race) for raw_race in raw_races]
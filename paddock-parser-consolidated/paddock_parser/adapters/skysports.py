@@ -45,7 +45,7 @@ class SkySportsAdapter(BaseAdapterV3):
         try:
             config = self.config_manager.get_config()
             response = await resilient_get(target_url, config)
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, "lxml")
             return self._parse_races(soup)
         except Exception as e:
             logging.error(
@@ -2,6 +2,11 @@ import logging
 import datetime as dt
 from datetime import date
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .base import BaseV2Adapter
 from ..fetching import resilient_get
 from ..sources import RawRaceDocument, FieldConfidence, register_adapter
@@ -16,6 +21,7 @@ class SportingLifeAdapter(BaseV2Adapter):
     """
 
     source_id = "sportinglife"
+    response_kind = "json"
 
     def _parse_api_data(self, json_data: dict) -> list[RawRaceDocument]:
         """Surgically parses the JSON response from the Sporting Life API."""
@@ -99,7 +105,12 @@ class SportingLifeAdapter(BaseV2Adapter):
                 logging.error(f"[{self.source_id}] Failed to fetch data from API.")
                 return []
 
-            json_data = response.json()
+            # Decode the API payload straight from bytes; orjson is much
+            # faster than the stdlib decoder for these response sizes.
+            if orjson is not None:
+                json_data = orjson.loads(response.content)
+            else:
+                json_data = response.json()
             return self._parse_api_data(json_data)
         except Exception as e:
             logging.error(
@@ -1,13 +1,17 @@
-import asyncio
 import datetime as dt
 import logging
-from urllib.parse import urlparse, urljoin
+import re
+from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from io import BytesIO
+
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from typing import Optional
 
 from .base_v3 import BaseAdapterV3
-from ..fetching import resilient_get, breadcrumb_get
+from ..fetching import resilient_get, breadcrumb_get, gather_limited
 from ..normalizer import canonical_track_key, canonical_race_key
 from ..sources import (
     FieldConfidence,
@@ -16,6 +20,29 @@ from ..sources import (
 )
 
 
+# One C-level match captures track, date and time from a racecard URL,
+# replacing the urlparse + strip + split + index dance per URL.
+_TF_URL_RE = re.compile(
+    r"/horse-racing/racecards/(?P<track>[^/]+)/(?P<date>\d{4}-\d{2}-\d{2})/(?P<time>\d{4})"
+)
+
+# Detail pages only matter for their runner rows, so parsing is restricted
+# to those subtrees and every CSS selector is compiled once at import
+# instead of on each of the hundreds of rows per scan.
+_RUNNER_ROW_STRAINER = SoupStrainer("div", class_="rp-racecard-runner-row")
+_SEL_RUNNER_ROW = sv.compile("div.rp-racecard-runner-row")
+_SEL_SADDLE_CLOTH = sv.compile(".rp-racecard-runner-saddle-cloth")
+_SEL_HORSE_NAME = sv.compile(".rp-racecard-runner-horse-name")
+_SEL_JOCKEY_NAME = sv.compile(".rp-racecard-runner-jockey-name")
+_SEL_TRAINER_NAME = sv.compile(".rp-racecard-runner-trainer-name")
+_SEL_ODDS = sv.compile(".rp-racecard-runner-odds .rp-price-button__price")
+
+
+def _select_one(pattern: sv.SoupSieve, tag):
+    matches = pattern.select(tag, limit=1)
+    return matches[0] if matches else None
+
+
 @register_adapter
 class TimeformAdapter(BaseAdapterV3):
     """
@@ -67,7 +94,7 @@ class TimeformAdapter(BaseAdapterV3):
 
             # Use breadcrumb_get to fetch the final page in the sequence
             list_response = await breadcrumb_get(breadcrumb_urls)
-            race_urls = self._parse_race_list(list_response.text)
+            race_urls = self._parse_race_list(list_response.content)
         except Exception as e:
             logging.error(f"[{self.source_id}] Failed to fetch or parse race list: {e}")
             return []
@@ -75,21 +102,25 @@ class TimeformAdapter(BaseAdapterV3):
         logging.info(f"[{self.source_id}] Found {len(race_urls)} race URLs to process.")
 
         tasks = [self._fetch_and_parse_race(url) for url in race_urls]
-        results = await asyncio.gather(*tasks)
-        return [doc for doc in results if doc]
+        concurrency = self.site_config.get("concurrency", 16)
+        results = await gather_limited(tasks, concurrency, return_exceptions=True)
+        return [doc for doc in results if isinstance(doc, RawRaceDocument)]
 
     async def _fetch_and_parse_race(self, url: str) -> Optional[RawRaceDocument]:
         """Fetches an individual race page and parses its details."""
         try:
+            match = _TF_URL_RE.search(url)
+            if not match:
+                logging.warning(f"[{self.source_id}] Unrecognised racecard URL format: {url}")
+                return None
+
             config = self.config_manager.get_config()
             response = await resilient_get(url, config)
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, "lxml", parse_only=_RUNNER_ROW_STRAINER)
 
-            path_parts = urlparse(url).path.strip("/").split("/")
-            track_name = path_parts[2].replace("-", " ")
-            track_key = canonical_track_key(track_name)
-            time_str = path_parts[4]
-            race_date = path_parts[3]
+            track_key = canonical_track_key(match["track"].replace("-", " "))
+            time_str = match["time"]
+            race_date = match["date"]
             race_key = canonical_race_key(track_key, time_str)
 
             runners = self._parse_race_details(soup, race_key)
@@ -109,14 +140,25 @@ class TimeformAdapter(BaseAdapterV3):
             )
             return None
 
-    def _parse_race_list(self, html_content: str) -> list[str]:
+    def _parse_race_list(self, html_content: bytes | str) -> list[str]:
         """
         Parses the main racecards page to find links to individual race pages.
+
+        Only anchor hrefs are needed, so the page is streamed through
+        lxml's iterparse instead of being materialised as a full soup;
+        each element is freed as soon as it has been inspected.
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-        race_links = {
-            urljoin(self._base_url, a["href"]) for a in soup.select("a.rp-racecard-race-link")
-        }
+        if isinstance(html_content, str):
+            html_content = html_content.encode("utf-8", errors="replace")
+        race_links = set()
+        for _event, el in etree.iterparse(
+            BytesIO(html_content), events=("end",), tag="a", html=True, recover=True
+        ):
+            if "rp-racecard-race-link" in (el.get("class") or "").split():
+                href = el.get("href")
+                if href:
+                    race_links.add(urljoin(self._base_url, href))
+            el.clear()
         return list(race_links)
 
     def _parse_race_details(self, soup: BeautifulSoup, race_key: str) -> list:
@@ -125,14 +167,14 @@ class TimeformAdapter(BaseAdapterV3):
 
         runners = []
         # This selector targets the rows in the main racecard table
-        runner_rows = soup.select("div.rp-racecard-runner-row")
+        runner_rows = _SEL_RUNNER_ROW.select(soup)
         for row in runner_rows:
             try:
-                saddle_cloth_el = row.select_one(".rp-racecard-runner-saddle-cloth")
-                horse_name_el = row.select_one(".rp-racecard-runner-horse-name")
-                jockey_name_el = row.select_one(".rp-racecard-runner-jockey-name")
-                trainer_name_el = row.select_one(".rp-racecard-runner-trainer-name")
-                odds_el = row.select_one(".rp-racecard-runner-odds .rp-price-button__price")
+                saddle_cloth_el = _select_one(_SEL_SADDLE_CLOTH, row)
+                horse_name_el = _select_one(_SEL_HORSE_NAME, row)
+                jockey_name_el = _select_one(_SEL_JOCKEY_NAME, row)
+                trainer_name_el = _select_one(_SEL_TRAINER_NAME, row)
+                odds_el = _select_one(_SEL_ODDS, row)
 
                 if not all([saddle_cloth_el, horse_name_el]):
                     continue
@@ -1,10 +1,163 @@
 import asyncio
+import heapq
 import logging
+import sys
+from collections import defaultdict
 from dataclasses import dataclass
-from itertools import groupby
-from operator import attrgetter
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+# NumPy lets score_races evaluate the piecewise scoring bands for a whole
+# batch of races in a few C-level passes; the scalar path remains both as
+# fallback and as the reference implementation.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba, when present, compiles the batched scoring arithmetic to native
+# loops; without it the NumPy searchsorted/select path is used instead.
+try:
+    import numba
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    _NUMBA_AVAILABLE = False
+
+if np is not None:
+    # Bin edges and values for the piecewise component scores whose bands
+    # are all half-open on the same side, so a single searchsorted lookup
+    # resolves them. Bands with mixed open/closed boundaries (spread,
+    # ratio, value) are handled with np.select in _score_batch instead.
+    _FS_EDGES = np.array([3.0, 5.0, 8.0, 11.0, 13.0])
+    _FS_VALUES = np.array([20.0, 60.0, 100.0, 80.0, 40.0, 20.0])
+    _FAV_EDGES = np.array([1.5, 2.5, 4.0, 6.0])
+    _FAV_VALUES = np.array([60.0, 100.0, 80.0, 50.0, 30.0])
+
+
+if np is not None and _NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _score_kernel(
+        field_size, fav, sec, third, avg, n_odds, w_fs, w_fav, w_spread, w_ratio, vw_odds, vw_comp
+    ):
+        """
+        Native batched scoring kernel. The branch chains mirror the scalar
+        V2Scorer band logic exactly (fastmath is deliberately off so the
+        weighted sums stay bit-identical to the NumPy and scalar paths).
+        """
+        n = field_size.shape[0]
+        total = np.empty(n)
+        fs_score = np.empty(n)
+        fav_score = np.empty(n)
+        spread = np.empty(n)
+        spread_score = np.empty(n)
+        ratio_out = np.empty(n)
+        ratio_score = np.empty(n)
+        value_total = np.empty(n)
+
+        for i in range(n):
+            f = field_size[i]
+            if 5 <= f <= 7:
+                fs = 100.0
+            elif 8 <= f <= 10:
+                fs = 80.0
+            elif 3 <= f <= 4:
+                fs = 60.0
+            elif 11 <= f <= 12:
+                fs = 40.0
+            else:
+                fs = 20.0
+            fs_score[i] = fs
+
+            fo = fav[i]
+            if fo < 1.5:
+                fv = 60.0
+            elif fo < 2.5:
+                fv = 100.0
+            elif fo < 4.0:
+                fv = 80.0
+            elif fo < 6.0:
+                fv = 50.0
+            else:
+                fv = 30.0
+            fav_score[i] = fv
+
+            s = sec[i] - fo
+            spread[i] = s
+            if s > 2.0:
+                ss = 100.0
+            elif s > 1.0:
+                ss = 80.0
+            elif s >= 0.5:
+                ss = 50.0
+            else:
+                ss = 30.0
+            spread_score[i] = ss
+
+            if n_odds[i] < 3:
+                rs = 20.0
+                ro = 0.0
+            elif avg[i] == 0.0:
+                rs = 0.0
+                ro = 0.0
+            else:
+                ro = fo / avg[i]
+                if ro >= 0.8:
+                    rs = 100.0
+                elif ro >= 0.7:
+                    rs = 90.0
+                elif ro >= 0.5:
+                    rs = 70.0
+                elif ro >= 0.3:
+                    rs = 50.0
+                else:
+                    rs = 40.0
+            ratio_score[i] = rs
+            ratio_out[i] = ro
+
+            total[i] = fs * w_fs + fv * w_fav + ss * w_spread + rs * w_ratio
+
+            t = third[i]
+            if 5.0 <= t < 10.0:
+                vo = 100.0
+            elif 10.0 <= t < 15.0:
+                vo = 80.0
+            elif 3.0 <= t < 5.0:
+                vo = 50.0
+            elif t >= 15.0:
+                vo = 20.0
+            else:
+                vo = 0.0
+            vs = t - fo
+            if vs < 4.0:
+                comp = 100.0
+            elif vs < 8.0:
+                comp = 70.0
+            else:
+                comp = 30.0
+            value_total[i] = vo * vw_odds + comp * vw_comp
+
+        return total, fs_score, fav_score, spread, spread_score, ratio_out, ratio_score, value_total
+
+    # Warm the compiled kernel at import so the first real batch does not
+    # pay compile (or cache-load) latency.
+    _score_kernel(
+        np.zeros(1),
+        np.zeros(1),
+        np.zeros(1),
+        np.zeros(1),
+        np.zeros(1),
+        np.zeros(1, dtype=np.intp),
+        0.25,
+        0.35,
+        0.10,
+        0.30,
+        0.6,
+        0.4,
+    )
+
 from .sources import ADAPTERS, RawRaceDocument
 from .normalizer import NormalizedRace, normalize_race_docs
 from .config_manager import config_manager
@@ -32,44 +185,80 @@ async def collect_all() -> List[RawRaceDocument]:
     Instantiates and runs all registered source adapters concurrently using the
     new V3 initialization pattern.
     """
-    logging.info(f"Found {len(ADAPTERS)} registered adapters.")
+    logging.info("Found %d registered adapters.", len(ADAPTERS))
 
-    tasks = []
-    for adapter_class in ADAPTERS:
-        # This is where the V3 architecture shines. We can now handle different
-        # adapter base classes and initialization routines gracefully.
+    config = config_manager.get_config()
 
+    # This is where the V3 architecture shines. We can now handle different
+    # adapter base classes and initialization routines gracefully.
+    v3_adapters = []
+    fetchers = []
+    for adapter_class in ADAPTERS.values():
         # V3 Adapter Workflow
         if issubclass(adapter_class, BaseAdapterV3):
-            adapter = adapter_class(config_manager)
-            if adapter.initialize():
-                logging.info(f"Running V3 adapter: {adapter.source_id}")
-                tasks.append(adapter.fetch())
+            v3_adapters.append(adapter_class(config_manager))
 
         # Legacy V2 Adapter Workflow (for backward compatibility)
         else:
             # V2 adapters expect the raw config dict
-            config_dict = config_manager.get_config()
-            adapter = adapter_class(config_dict)
+            adapter = adapter_class(config)
             if hasattr(adapter, "site_config") and adapter.site_config is not None:
-                logging.info(f"Running legacy V2 adapter: {adapter.source_id}")
-                tasks.append(adapter.fetch())
+                logging.info("Running legacy V2 adapter: %s", adapter.source_id)
+                fetchers.append(adapter)
+
+    # Phase 1: initialize V3 adapters concurrently. initialize() is
+    # synchronous (config reads, possibly disk I/O), so each runs in a
+    # worker thread rather than serialising on the event loop. Failures
+    # are handled at the await site, so the gather carries plain booleans
+    # instead of exception objects needing isinstance triage.
+    async def _init(adapter) -> bool:
+        try:
+            return await asyncio.to_thread(adapter.initialize)
+        except Exception as e:
+            logging.error("Adapter %s failed to initialize: %s", adapter.source_id, e)
+            return False
 
-    if not tasks:
+    init_results = await asyncio.gather(*(_init(a) for a in v3_adapters))
+    for adapter, initialized in zip(v3_adapters, init_results):
+        if initialized:
+            logging.info("Running V3 adapter: %s", adapter.source_id)
+            fetchers.append(adapter)
+
+    if not fetchers:
         logging.warning("No enabled and initialized adapters found to run.")
         return []
 
-    logging.info(f"Running {len(tasks)} adapters concurrently.")
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Phase 2: fetch under a concurrency cap so a tree with many adapters
+    # cannot flood upstream sources all at once.
+    sem = asyncio.Semaphore(config.get("MAX_CONCURRENT_FETCH", 8))
+
+    async def _run(adapter):
+        async with sem:
+            return await adapter.fetch()
 
+    logging.info("Running %d adapters concurrently.", len(fetchers))
+
+    # Fold each adapter's batch in as it completes instead of blocking on
+    # the slowest one, so progress and failures surface incrementally.
     all_docs = []
-    for res in results:
+    completed = 0
+    for future in asyncio.as_completed([_run(a) for a in fetchers]):
+        completed += 1
+        try:
+            res = await future
+        except Exception as e:
+            logging.error("Adapter failed to fetch: %s", e, exc_info=e)
+            continue
         if isinstance(res, list):
             all_docs.extend(res)
-        elif isinstance(res, Exception):
-            logging.error(f"Adapter failed to fetch: {res}", exc_info=res)
+        logging.info(
+            "Adapter %d/%d complete (%d documents so far).",
+            completed,
+            len(fetchers),
+            len(all_docs),
+        )
 
-    logging.info(f"Collected {len(all_docs)} raw race documents from all sources.")
+    logging.info("Collected %d raw race documents from all sources.", len(all_docs))
     return all_docs
 
 
@@ -80,13 +269,15 @@ def coalesce_docs(docs: List[RawRaceDocument]) -> Dict[str, List[RawRaceDocument
     if not docs:
         return {}
 
-    sorted_docs = sorted(docs, key=attrgetter("race_key"))
-
-    grouped_by_race = {
-        key: list(group) for key, group in groupby(sorted_docs, key=attrgetter("race_key"))
-    }
+    # Single O(n) bucketing pass; the previous sort+groupby pairing ordered
+    # the whole list just to cluster equal keys, and nothing downstream
+    # relies on key order.
+    buckets: Dict[str, List[RawRaceDocument]] = defaultdict(list)
+    for doc in docs:
+        buckets[doc.race_key].append(doc)
+    grouped_by_race = dict(buckets)
 
-    logging.info(f"Coalesced {len(docs)} documents into {len(grouped_by_race)} unique races.")
+    logging.info("Coalesced %d documents into %d unique races.", len(docs), len(grouped_by_race))
     return grouped_by_race
 
 
@@ -109,50 +300,91 @@ def normalize_and_merge(race_docs: List[RawRaceDocument]) -> NormalizedRace:
 # --- V2 SCORING LOGIC ---
 
 
+@lru_cache(maxsize=1)
+def _resolved_weights() -> tuple[tuple, tuple]:
+    """
+    Resolves and normalizes the main and value scorer weights from config.
+
+    Returned as two tuples of (key, weight) items so the result is hashable
+    and immutable. Cached because V2Scorer is re-instantiated on every
+    score_races call and the config does not change between calls; the
+    cache is cleared via config_manager's invalidation hooks on reload.
+    """
+    config = config_manager.get_config()
+
+    # --- Main Scorer Weights ---
+    default_weights = {
+        "FIELD_SIZE": 0.25,
+        "FAVORITE_ODDS": 0.35,
+        "ODDS_SPREAD": 0.10,
+        "VALUE_VS_SP": 0.30,
+    }
+    scorer_weights = dict(config.get("SCORER_WEIGHTS", default_weights))
+    for key, value in default_weights.items():
+        if key not in scorer_weights:
+            scorer_weights[key] = value
+            logging.warning("Missing '%s' in SCORER_WEIGHTS, using default: %s", key, value)
+
+    total_weight = sum(scorer_weights.values())
+    weights = (
+        {k: v / total_weight for k, v in scorer_weights.items()}
+        if total_weight
+        else default_weights
+    )
+    logging.info("Resolved main scorer weights: %s", weights)
+
+    # --- Best Value Scorer Weights ---
+    default_value_weights = {"VALUE_ODDS_WEIGHT": 0.6, "VALUE_COMPETITIVENESS_WEIGHT": 0.4}
+    value_weights = dict(config.get("BEST_VALUE_WEIGHTS", default_value_weights))
+    for key, value in default_value_weights.items():
+        if key not in value_weights:
+            value_weights[key] = value
+            logging.warning("Missing '%s' in BEST_VALUE_WEIGHTS, using default: %s", key, value)
+
+    total_value_weight = sum(value_weights.values())
+    resolved_value_weights = (
+        {k: v / total_value_weight for k, v in value_weights.items()}
+        if total_value_weight
+        else default_value_weights
+    )
+    logging.info("Resolved value scorer weights: %s", resolved_value_weights)
+
+    return tuple(weights.items()), tuple(resolved_value_weights.items())
+
+
+@lru_cache(maxsize=1)
+def _race_filters() -> tuple[int, int]:
+    """Returns the cached (MIN_RUNNERS, MAX_RUNNERS) race filter bounds."""
+    filter_config = config_manager.get_config().get("RACE_FILTERS", {})
+    return filter_config.get("MIN_RUNNERS", 0), filter_config.get("MAX_RUNNERS", 99)
+
+
+config_manager.register_invalidation_hook(_resolved_weights.cache_clear)
+config_manager.register_invalidation_hook(_race_filters.cache_clear)
+
+
 class V2Scorer:
     """
     Analyzes a NormalizedRace to produce a score based on various signals.
-    Now uses the global config_manager for settings.
+    Weights are resolved once per config load via _resolved_weights.
     """
 
     def __init__(self):
-        config = config_manager.get_config()
-        # --- Main Scorer Weights ---
-        default_weights = {
-            "FIELD_SIZE": 0.25,
-            "FAVORITE_ODDS": 0.35,
-            "ODDS_SPREAD": 0.10,
-            "VALUE_VS_SP": 0.30,
-        }
-        scorer_weights = config.get("SCORER_WEIGHTS", default_weights)
-        for key, value in default_weights.items():
-            if key not in scorer_weights:
-                scorer_weights[key] = value
-                logging.warning(f"Missing '{key}' in SCORER_WEIGHTS, using default: {value}")
-
-        total_weight = sum(scorer_weights.values())
-        self.weights = (
-            {k: v / total_weight for k, v in scorer_weights.items()}
-            if total_weight
-            else default_weights
+        main_items, value_items = _resolved_weights()
+        self.weights = dict(main_items)
+        self.value_weights = dict(value_items)
+        # Positional copies of the hot weights: score_race runs per race, so
+        # the four string-keyed dict probes are paid once here instead.
+        self._w = (
+            self.weights["FIELD_SIZE"],
+            self.weights["FAVORITE_ODDS"],
+            self.weights["ODDS_SPREAD"],
+            self.weights["VALUE_VS_SP"],
         )
-        logging.info(f"V2Scorer initialized with main weights: {self.weights}")
-
-        # --- Best Value Scorer Weights ---
-        default_value_weights = {"VALUE_ODDS_WEIGHT": 0.6, "VALUE_COMPETITIVENESS_WEIGHT": 0.4}
-        value_weights = config.get("BEST_VALUE_WEIGHTS", default_value_weights)
-        for key, value in default_value_weights.items():
-            if key not in value_weights:
-                value_weights[key] = value
-                logging.warning(f"Missing '{key}' in BEST_VALUE_WEIGHTS, using default: {value}")
-
-        total_value_weight = sum(value_weights.values())
-        self.value_weights = (
-            {k: v / total_value_weight for k, v in value_weights.items()}
-            if total_value_weight
-            else default_value_weights
+        self._vw = (
+            self.value_weights["VALUE_ODDS_WEIGHT"],
+            self.value_weights["VALUE_COMPETITIVENESS_WEIGHT"],
         )
-        logging.info(f"V2Scorer initialized with value weights: {self.value_weights}")
 
     def _get_field_size_score(self, field_size: int) -> float:
         if 5 <= field_size <= 7:
@@ -192,11 +424,31 @@ class V2Scorer:
             return 50.0
         return 30.0
 
-    def _get_fav_vs_field_ratio_score(self, runners: list) -> tuple[float, float]:
-        if len(runners) < 3:
+    def _race_odds_stats(self, race: NormalizedRace) -> tuple[list, float, int]:
+        """
+        Derives the odds inputs for scoring in a single traversal: the top-3
+        runners by odds, the average odds, and the number of runners carrying
+        odds. Only the top three are ever inspected downstream (favorite,
+        second favorite, value horse), so a partial selection replaces the
+        previous full sort of the field.
+        """
+        runners_with_odds = []
+        total = 0.0
+        for r in race.runners:
+            odds = r.odds_decimal
+            if odds is not None:
+                runners_with_odds.append(r)
+                total += odds
+        n = len(runners_with_odds)
+        top3 = heapq.nsmallest(3, runners_with_odds, key=lambda r: r.odds_decimal)
+        avg_odds = total / n if n else 0.0
+        return top3, avg_odds, n
+
+    def _get_fav_vs_field_ratio_score(
+        self, fav_odds: Optional[float], avg_odds: float, n: int
+    ) -> tuple[float, float]:
+        if n < 3:
             return 20.0, 0.0
-        fav_odds = runners[0].odds_decimal
-        avg_odds = sum(r.odds_decimal for r in runners) / len(runners)
         if avg_odds == 0:
             return 0.0, 0.0
         ratio = fav_odds / avg_odds
@@ -210,18 +462,16 @@ class V2Scorer:
             return 50.0, ratio
         return 40.0, ratio
 
-    def _get_best_value_score(
-        self, runners_with_odds: list
-    ) -> tuple[Optional[float], Optional[str]]:
+    def _get_best_value_score(self, top3: list) -> tuple[Optional[float], Optional[str]]:
         """
         Calculates a 'Best Value' score by identifying a horse (3rd favorite)
         that has a good combination of high odds and competitiveness.
         """
-        if len(runners_with_odds) < 3:
+        if len(top3) < 3:
             return None, "Not enough runners for value score."
 
-        fav_horse = runners_with_odds[0]
-        value_horse = runners_with_odds[2]  # Target the 3rd favorite as the "value horse"
+        fav_horse = top3[0]
+        value_horse = top3[2]  # Target the 3rd favorite as the "value horse"
 
         value_horse_odds = value_horse.odds_decimal
         fav_odds = fav_horse.odds_decimal
@@ -251,39 +501,37 @@ class V2Scorer:
             competitiveness_score = 30.0
 
         # 3. Calculate final weighted score
-        final_value_score = (value_odds_score * self.value_weights["VALUE_ODDS_WEIGHT"]) + (
-            competitiveness_score * self.value_weights["VALUE_COMPETITIVENESS_WEIGHT"]
-        )
+        vw_odds, vw_comp = self._vw
+        final_value_score = (value_odds_score * vw_odds) + (competitiveness_score * vw_comp)
 
         reason = f"Value Pick: {value_horse.name} ({value_horse_odds:.2f})"
         return round(final_value_score, 2), reason
 
     def score_race(self, race: NormalizedRace) -> ScoreResult:
         """Calculates a score for a single normalized race."""
-        runners_with_odds = sorted(
-            [r for r in race.runners if r.odds_decimal is not None], key=lambda r: r.odds_decimal
-        )
+        top3, avg_odds, n_odds = self._race_odds_stats(race)
 
-        if len(runners_with_odds) < 2:
+        if n_odds < 2:
             return ScoreResult(race=race, score=0.0, reason="Not enough runners with odds.")
 
-        favorite = runners_with_odds[0]
-        second_favorite = runners_with_odds[1]
-        fav_odds = favorite.odds_decimal
-        sec_fav_odds = second_favorite.odds_decimal
+        fav_odds = top3[0].odds_decimal
+        sec_fav_odds = top3[1].odds_decimal
         field_size = len(race.runners)
 
         # Calculate main component scores
         field_size_score = self._get_field_size_score(field_size)
         fav_odds_score = self._get_fav_odds_score(fav_odds)
         spread_score = self._get_odds_spread_score(fav_odds, sec_fav_odds)
-        fav_ratio_score, fav_ratio = self._get_fav_vs_field_ratio_score(runners_with_odds)
+        fav_ratio_score, fav_ratio = self._get_fav_vs_field_ratio_score(
+            fav_odds, avg_odds, n_odds
+        )
 
+        w_fs, w_fav, w_spread, w_ratio = self._w
         final_score = (
-            (field_size_score * self.weights["FIELD_SIZE"])
-            + (fav_odds_score * self.weights["FAVORITE_ODDS"])
-            + (spread_score * self.weights["ODDS_SPREAD"])
-            + (fav_ratio_score * self.weights["VALUE_VS_SP"])
+            (field_size_score * w_fs)
+            + (fav_odds_score * w_fav)
+            + (spread_score * w_spread)
+            + (fav_ratio_score * w_ratio)
         )
         reason = (
             f"Field: {field_size} ({field_size_score:.0f}), "
@@ -293,7 +541,7 @@ class V2Scorer:
         )
 
         # Calculate best value score
-        best_value_score, best_value_reason = self._get_best_value_score(runners_with_odds)
+        best_value_score, best_value_reason = self._get_best_value_score(top3)
 
         return ScoreResult(
             race=race,
@@ -303,6 +551,146 @@ class V2Scorer:
             best_value_reason=best_value_reason,
         )
 
+    def score_batch(self, races: List[NormalizedRace]) -> List[ScoreResult]:
+        """
+        Scores many races at once, vectorizing the band arithmetic when
+        NumPy is available; results are identical to per-race score_race.
+        """
+        if np is not None:
+            return _score_batch(self, races)
+        return [self.score_race(race) for race in races]
+
+
+def _score_batch(scorer: V2Scorer, races: List[NormalizedRace]) -> List[ScoreResult]:
+    """
+    Scores a batch of races with vectorized band lookups.
+
+    The per-race Python work is reduced to gathering the odds inputs and
+    formatting the reason strings; every piecewise band and the weighted
+    combination are evaluated across the whole batch in NumPy. Must stay
+    in lockstep with V2Scorer.score_race, which remains the scalar
+    reference implementation (and the fallback when NumPy is missing).
+    """
+    n = len(races)
+    field_size = np.zeros(n)
+    fav = np.zeros(n)
+    sec = np.zeros(n)
+    third = np.zeros(n)
+    avg = np.zeros(n)
+    n_odds = np.zeros(n, dtype=np.intp)
+    top3_by_race: List[list] = []
+
+    for i, race in enumerate(races):
+        top3, avg_odds, k = scorer._race_odds_stats(race)
+        top3_by_race.append(top3)
+        field_size[i] = len(race.runners)
+        n_odds[i] = k
+        if k:
+            fav[i] = top3[0].odds_decimal
+            avg[i] = avg_odds
+        if k > 1:
+            sec[i] = top3[1].odds_decimal
+        if k > 2:
+            third[i] = top3[2].odds_decimal
+
+    w = scorer.weights
+    vw = scorer.value_weights
+
+    if _NUMBA_AVAILABLE:
+        (
+            total,
+            fs_score,
+            fav_score,
+            spread,
+            spread_score,
+            ratio_out,
+            ratio_score,
+            value_total,
+        ) = _score_kernel(
+            field_size,
+            fav,
+            sec,
+            third,
+            avg,
+            n_odds,
+            w["FIELD_SIZE"],
+            w["FAVORITE_ODDS"],
+            w["ODDS_SPREAD"],
+            w["VALUE_VS_SP"],
+            vw["VALUE_ODDS_WEIGHT"],
+            vw["VALUE_COMPETITIVENESS_WEIGHT"],
+        )
+    else:
+        fs_score = _FS_VALUES[np.searchsorted(_FS_EDGES, field_size, side="right")]
+        fav_score = _FAV_VALUES[np.searchsorted(_FAV_EDGES, fav, side="right")]
+
+        spread = sec - fav
+        spread_score = np.select(
+            [spread > 2.0, spread > 1.0, spread >= 0.5], [100.0, 80.0, 50.0], 30.0
+        )
+
+        ratio = np.divide(fav, avg, out=np.zeros(n), where=avg != 0.0)
+        ratio_score = np.select(
+            [n_odds < 3, avg == 0.0, ratio >= 0.8, ratio >= 0.7, ratio >= 0.5, ratio >= 0.3],
+            [20.0, 0.0, 100.0, 90.0, 70.0, 50.0],
+            40.0,
+        )
+        ratio_out = np.where((n_odds < 3) | (avg == 0.0), 0.0, ratio)
+
+        total = (
+            fs_score * w["FIELD_SIZE"]
+            + fav_score * w["FAVORITE_ODDS"]
+            + spread_score * w["ODDS_SPREAD"]
+            + ratio_score * w["VALUE_VS_SP"]
+        )
+
+        value_odds_score = np.select(
+            [third < 3.0, third < 5.0, third < 10.0, third < 15.0],
+            [0.0, 50.0, 100.0, 80.0],
+            20.0,
+        )
+        value_spread = third - fav
+        comp_score = np.select([value_spread < 4.0, value_spread < 8.0], [100.0, 70.0], 30.0)
+        value_total = (
+            value_odds_score * vw["VALUE_ODDS_WEIGHT"]
+            + comp_score * vw["VALUE_COMPETITIVENESS_WEIGHT"]
+        )
+
+    results: List[ScoreResult] = []
+    for i, race in enumerate(races):
+        k = n_odds[i]
+        if k < 2:
+            results.append(
+                ScoreResult(race=race, score=0.0, reason="Not enough runners with odds.")
+            )
+            continue
+
+        reason = (
+            f"Field: {int(field_size[i])} ({fs_score[i]:.0f}), "
+            f"Fav Odds: {fav[i]:.2f} ({fav_score[i]:.0f}), "
+            f"Spread: {spread[i]:.2f} ({spread_score[i]:.0f}), "
+            f"FavRatio: {ratio_out[i]:.2f}({ratio_score[i]:.0f})"
+        )
+
+        if k < 3:
+            best_value_score = None
+            best_value_reason = "Not enough runners for value score."
+        else:
+            value_horse = top3_by_race[i][2]
+            best_value_score = round(float(value_total[i]), 2)
+            best_value_reason = f"Value Pick: {value_horse.name} ({third[i]:.2f})"
+
+        results.append(
+            ScoreResult(
+                race=race,
+                score=round(float(total[i]), 2),
+                reason=reason,
+                best_value_score=best_value_score,
+                best_value_reason=best_value_reason,
+            )
+        )
+    return results
+
 
 def score_races(races: List[NormalizedRace]) -> tuple[List[ScoreResult], int, int]:
     """
@@ -310,10 +698,7 @@ def score_races(races: List[NormalizedRace]) -> tuple[List[ScoreResult], int, in
     Returns the scored results, the initial count, and the final count after filtering.
     """
     # --- Filter races based on runner count ---
-    config = config_manager.get_config()
-    filter_config = config.get("RACE_FILTERS", {})
-    min_runners = filter_config.get("MIN_RUNNERS", 0)
-    max_runners = filter_config.get("MAX_RUNNERS", 99)
+    min_runners, max_runners = _race_filters()
 
     initial_race_count = len(races)
     filtered_races = [race for race in races if min_runners <= len(race.runners) <= max_runners]
@@ -329,9 +714,9 @@ def score_races(races: List[NormalizedRace]) -> tuple[List[ScoreResult], int, in
         return [], initial_race_count, 0
 
     scorer = V2Scorer()
-    scored_races = [scorer.score_race(race) for race in filtered_races]
+    scored_races = scorer.score_batch(filtered_races)
 
-    logging.info(f"Scored {len(scored_races)} races.")
+    logging.info("Scored %d races.", len(scored_races))
     sorted_results = sorted(scored_races, key=lambda r: r.score, reverse=True)
     return sorted_results, initial_race_count, final_race_count
 
@@ -339,6 +724,12 @@ def score_races(races: List[NormalizedRace]) -> tuple[List[ScoreResult], int, in
 # --- Reporting ---
 
 
+def _saddle_key(runner) -> int:
+    """Sort key for display: numeric saddle cloth, with non-numeric last."""
+    cloth = runner.saddle_cloth
+    return int(cloth) if cloth and cloth.isdigit() else 999
+
+
 def display_results_console(
     scored_results: List[ScoreResult], initial_count: int, final_count: int
 ):
@@ -347,40 +738,42 @@ def display_results_console(
     """
     logging.info("--- V2 PIPELINE RESULTS ---")
 
-    config = config_manager.get_config()
-    filter_config = config.get("RACE_FILTERS", {})
-    min_runners = filter_config.get("MIN_RUNNERS", 0)
-    max_runners = filter_config.get("MAX_RUNNERS", 99)
+    min_runners, max_runners = _race_filters()
+
+    # Buffer the whole report and emit it with one write: a print per line
+    # means a flush/syscall per line, which is visibly slow on remote or
+    # Windows consoles for a long result list.
+    lines = []
 
     if final_count < initial_count:
-        print(
+        lines.append(
             f"\nFiltered {initial_count - final_count} of {initial_count} races to meet criteria (Runners: {min_runners}-{max_runners})."
         )
 
     if not scored_results:
-        print("No races matching the criteria were found.")
+        lines.append("No races matching the criteria were found.")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
-    print(f"Displaying top {len(scored_results)} scored and filtered races:")
+    lines.append(f"Displaying top {len(scored_results)} scored and filtered races:")
     for result in scored_results:
-        print("-" * 50)
-        print(f"Race: {result.race.race_key} (Score: {result.score})")
+        lines.append("-" * 50)
+        lines.append(f"Race: {result.race.race_key} (Score: {result.score})")
         if result.best_value_score is not None:
-            print(f"  Value Score: {result.best_value_score} ({result.best_value_reason})")
-        print(f"  Reason: {result.reason}")
-        print(f"  Start Time: {result.race.start_time_iso}")
-        print(f"  Sources: {', '.join(result.race.source_ids)}")
-        print(f"  Runners ({len(result.race.runners)}):")
+            lines.append(f"  Value Score: {result.best_value_score} ({result.best_value_reason})")
+        lines.append(f"  Reason: {result.reason}")
+        lines.append(f"  Start Time: {result.race.start_time_iso}")
+        lines.append(f"  Sources: {', '.join(result.race.source_ids)}")
+        lines.append(f"  Runners ({len(result.race.runners)}):")
         # Sort runners by saddle cloth number for consistent display
-        sorted_runners = sorted(
-            result.race.runners,
-            key=lambda r: int(r.saddle_cloth)
-            if r.saddle_cloth and r.saddle_cloth.isdigit()
-            else 999,
+        sorted_runners = sorted(result.race.runners, key=_saddle_key)
+        lines.extend(
+            f"    - {r.saddle_cloth}. {r.name} "
+            f"({f'{r.odds_decimal:.2f}' if r.odds_decimal else 'N/A'})"
+            for r in sorted_runners
         )
-        for runner in sorted_runners:
-            odds = f"{runner.odds_decimal:.2f}" if runner.odds_decimal else "N/A"
-            print(f"    - {runner.saddle_cloth}. {runner.name} ({odds})")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # --- Main Pipeline Orchestrator ---
@@ -402,7 +795,7 @@ def normalize_races_from_docs(raw_docs: List[RawRaceDocument]) -> List[Normalize
             normalized_race = normalize_and_merge(docs)
             normalized_races.append(normalized_race)
         except Exception as e:
-            logging.error(f"Failed to normalize race {race_key}: {e}", exc_info=True)
+            logging.error("Failed to normalize race %s: %s", race_key, e, exc_info=True)
 
     return normalized_races
 
@@ -3,6 +3,11 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 
 class ConfigurationManager:
     """
@@ -24,6 +29,7 @@ class ConfigurationManager:
             return
 
         self.config_path = Path(config_path)
+        self._invalidation_hooks: list = []
         self._config = self._load_config()
         logging.info(f"ConfigurationManager initialized with config from '{self.config_path}'.")
 
@@ -31,18 +37,79 @@ class ConfigurationManager:
         """
         Loads the main configuration file from the specified path.
         """
+        self._config_mtime_ns = self._stat_mtime_ns()
         if not self.config_path.exists():
             logging.critical(f"FATAL: Configuration file '{self.config_path}' not found.")
             return {}
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            if orjson is not None:
+                config = orjson.loads(self.config_path.read_bytes())
+            else:
+                with open(self.config_path, "r", encoding="utf-8") as f:
+                    config = json.load(f)
+            self._inject_base_urls(config)
+            return config
+        except (json.JSONDecodeError, ValueError) as e:
             logging.critical(
                 f"FATAL: Could not parse configuration file '{self.config_path}': {e}."
             )
             return {}
 
+    @staticmethod
+    def _inject_base_urls(config: Dict[str, Any]) -> None:
+        """
+        Derives base_url for each DATA_SOURCES_V2 entry once at load time,
+        so adapter construction is a pure dict lookup instead of repeating
+        urlparse (and mutating the shared config) per instantiation.
+        """
+        from urllib.parse import urlparse
+
+        for site_config in config.get("DATA_SOURCES_V2", {}).values():
+            if "base_url" not in site_config and "url" in site_config:
+                parsed_url = urlparse(site_config["url"])
+                site_config["base_url"] = f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+    def _stat_mtime_ns(self) -> Optional[int]:
+        try:
+            return self.config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @property
+    def _config(self) -> Dict[str, Any]:
+        return self._config_data
+
+    @_config.setter
+    def _config(self, value: Dict[str, Any]) -> None:
+        # Assignment is the single choke point for config changes — both
+        # reload() and tests that swap _config directly go through here,
+        # so registered caches are always notified.
+        self._config_data = value
+        for hook in getattr(self, "_invalidation_hooks", ()):
+            hook()
+
+    def register_invalidation_hook(self, callback) -> None:
+        """
+        Registers a zero-argument callable invoked whenever the configuration
+        is reloaded. Modules that cache values derived from the config (e.g.
+        resolved scorer weights) use this to clear their caches.
+        """
+        self._invalidation_hooks.append(callback)
+
+    def reload(self) -> None:
+        """
+        Re-reads the configuration file; the assignment notifies registered
+        caches via the _config setter. If the file's mtime is unchanged the
+        reload is skipped entirely, so derived caches (scorer weights,
+        fingerprint rotation, ...) are not invalidated for nothing.
+        """
+        mtime = self._stat_mtime_ns()
+        if mtime is not None and mtime == getattr(self, "_config_mtime_ns", None):
+            logging.debug(f"Configuration '{self.config_path}' unchanged; reload skipped.")
+            return
+        self._config = self._load_config()
+        logging.info(f"Configuration reloaded from '{self.config_path}'.")
+
     def get_config(self) -> Dict[str, Any]:
         """
         Returns the entire loaded configuration dictionary.
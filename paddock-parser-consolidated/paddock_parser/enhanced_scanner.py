@@ -6,15 +6,22 @@ will now ignore any data source that is marked as disabled.
 """
 
 import sys
+import aiofiles
 import asyncio
 import httpx
+import json
 import logging
+from collections import defaultdict
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List
+from urllib.parse import urlparse
 import re
 import unicodedata
 
+logger = logging.getLogger(__name__)
+
 # --- Refactored Imports ---
 from .config_manager import config_manager
 from .fetching import get_shared_async_client, breadcrumb_get, resilient_get
@@ -33,120 +40,311 @@ def build_httpx_client_kwargs() -> Dict[str, Any]:
     proxies = http_client.get("PROXIES")
 
     verify: Any = ca_bundle if ca_bundle else verify_ssl
-    kwargs: Dict[str, Any] = {"verify": verify}
+    kwargs: Dict[str, Any] = {
+        "verify": verify,
+        "http2": True,
+        "limits": httpx.Limits(
+            max_keepalive_connections=100,
+            max_connections=200,
+            keepalive_expiry=300.0,
+        ),
+    }
     if proxies:
         kwargs["proxies"] = proxies
     return kwargs
 
 
+# Shared scanner client: prefetch and connection-testing used to open (and
+# tear down) a fresh AsyncClient per menu action, re-handshaking TCP+TLS for
+# every host each time. Reusing one client keeps warmed connection pools
+# alive across runs; main.py closes it on shutdown. Each menu action runs
+# under its own asyncio.run() loop, so the client is bound to the loop it
+# was created on: a pooled socket from a destroyed loop raises "Event loop
+# is closed" on reuse, and is_closed never catches that.
+_scanner_client: httpx.AsyncClient | None = None
+_scanner_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _log_response(response: httpx.Response) -> None:
+    """Client-level response hook: one place logs every scanner response."""
+    logger.info(
+        "[RESPONSE] %d %s (%s)", response.status_code, response.request.url, response.http_version
+    )
+
+
+def get_scanner_client() -> httpx.AsyncClient:
+    global _scanner_client, _scanner_client_loop
+    loop = asyncio.get_running_loop()
+    if _scanner_client is not None and _scanner_client_loop is not loop:
+        # Leftover from a previous asyncio.run(): its sockets belong to a
+        # loop that no longer exists, so it cannot be awaited closed here.
+        # Drop the reference and let the pool's finalizers reclaim them.
+        _scanner_client = None
+    if _scanner_client is None or _scanner_client.is_closed:
+        _scanner_client_loop = loop
+        kwargs = build_httpx_client_kwargs()
+        # No per-request DNS tricks here: the pool's five-minute keep-alive
+        # already limits lookups to one per origin per expiry, and httpx
+        # offers no hook to resolve below the pool without rewriting URLs,
+        # which would key pooled connections by IP and let two hostnames on
+        # one CDN address share a TLS session negotiated for the other.
+        _scanner_client = httpx.AsyncClient(
+            follow_redirects=True, event_hooks={"response": [_log_response]}, **kwargs
+        )
+    return _scanner_client
+
+
+async def close_scanner_client():
+    global _scanner_client, _scanner_client_loop
+    client, loop = _scanner_client, _scanner_client_loop
+    _scanner_client = None
+    _scanner_client_loop = None
+    if client is None:
+        return
+    if loop is asyncio.get_running_loop():
+        await client.aclose()
+    # Otherwise the owning loop is already gone (main.py calls this from a
+    # fresh asyncio.run() on shutdown); awaiting aclose() would touch sockets
+    # bound to the dead loop, so dropping the reference is all that's safe.
+
+
 # - Helper Function for Filename Sanitization -
+_NON_WORD_RE = re.compile(r"[^\w\s-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
 def sanitize_filename(name: str) -> str:
-    """Cleans a string to be a valid filename."""
+    """Cleans a string to be a valid filename.
+
+    Cached: the same ~30 configured site names come through on every
+    prefetch run, so the NFKD normalisation and substitutions run once
+    per distinct name.
+    """
     name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
-    name = re.sub(r"[^\w\s-]", "_", name).strip()
-    name = re.sub(r"\s+", "_", name)
+    name = _NON_WORD_RE.sub("_", name).strip()
+    name = _WHITESPACE_RE.sub("_", name)
     return name
 
 
+@lru_cache(maxsize=1024)
+def _format_site_url(url_template: str, date_str: str) -> str:
+    """Formats a site URL for a given day once; the date key means the
+    cache rolls over naturally at midnight."""
+    return url_template.format(date_str_iso=date_str)
+
+
 # --- Core Fetching & Parsing Functions ---
 async def fetch_url(client: httpx.AsyncClient, url: str) -> str:
     """Fetches content from a URL using configured headers."""
     config = config_manager.get_config()
-    logging.info(f"Fetching URL: {url}")
+    logger.info("Fetching URL: %s", url)
     headers = config.get("StealthHeaders", {})  # Using StealthHeaders as per config
     timeout = config.get("HTTP_CLIENT", {}).get("REQUEST_TIMEOUT", 30.0)
+    # Success logging lives in the client's response hook; the hot path
+    # here stays a single try with one except arm.
     try:
         response = await client.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
-        logging.info(f"[SUCCESS] Fetched {len(response.text)} chars from {url}")
-        return response.text
-    except httpx.HTTPStatusError as e:
-        logging.error(f"[ERROR] HTTP Error {e.response.status_code} for {url}: {e}")
-    except httpx.RequestError as e:
-        logging.error(f"[ERROR] Request Error for {url}: {e}")
-    except Exception as e:
-        logging.error(f"[ERROR] Unexpected error fetching {url}: {e}")
+        # Decode with the header-declared charset (default UTF-8) instead of
+        # response.text, whose charset sniffing is costly on large pages.
+        enc = response.charset_encoding or "utf-8"
+        return response.content.decode(enc, errors="replace")
+    except httpx.HTTPError as e:
+        logger.error("[ERROR] %s fetching %s: %s", type(e).__name__, url, e)
     return ""
 
 
 # --- Prefetching Logic ---
-async def prefetch_source(client: httpx.AsyncClient, site: Dict[str, Any], today_str: str) -> bool:
-    """Fetches and saves a single data source to the input directory."""
+# Sidecar in the input directory mapping url -> {etag, last_modified}, so
+# unchanged racecards come back as body-less 304s on the next run.
+ETAG_SIDECAR = ".etags.json"
+
+
+def _load_etag_index(input_dir: Path) -> Dict[str, Dict[str, str]]:
+    try:
+        with open(input_dir / ETAG_SIDECAR, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+async def _save_etag_index(input_dir: Path, index: Dict[str, Dict[str, str]]) -> None:
+    # One write at the end of the batch rather than per request.
+    async with aiofiles.open(input_dir / ETAG_SIDECAR, "w", encoding="utf-8") as f:
+        await f.write(json.dumps(index, indent=2))
+
+
+async def prefetch_source(
+    client: httpx.AsyncClient,
+    site: Dict[str, Any],
+    today_str: str,
+    etag_index: Dict[str, Dict[str, str]] | None = None,
+    input_dir: Path | None = None,
+) -> bool:
+    """Streams a single data source straight to the input directory.
+
+    The response is written chunk-by-chunk through aiofiles, so the page
+    body is never held in memory as one string and the blocking disk
+    flush happens off the event loop instead of stalling sibling fetches.
+    Batch callers pass input_dir so the mkdir syscall happens once per
+    run rather than once per source.
+    """
     config = config_manager.get_config()
-    input_dir = Path(config["INPUT_DIR"])
-    input_dir.mkdir(exist_ok=True, parents=True)
-    url = site["url"].format(date_str_iso=today_str)
-    logging.info(f"Prefetching: {site['name']}")
-    content = await fetch_url(client, url)
-    if content:
-        filename = sanitize_filename(site["name"]) + ".html"
-        output_path = input_dir / filename
-        try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(content)
-            logging.info(f"[SUCCESS] Saved '{site['name']}' to {output_path}")
-            return True
-        except Exception as e:
-            logging.error(f"[ERROR] Failed to write file for '{site['name']}': {e}")
+    if input_dir is None:
+        input_dir = Path(config["INPUT_DIR"])
+        input_dir.mkdir(exist_ok=True, parents=True)
+    url = _format_site_url(site["url"], today_str)
+    logger.info("Prefetching: %s", site["name"])
+    headers = dict(config.get("StealthHeaders", {}))
+    timeout = config.get("HTTP_CLIENT", {}).get("REQUEST_TIMEOUT", 30.0)
+    output_path = input_dir / (sanitize_filename(site["name"]) + ".html")
+    validators = (etag_index or {}).get(url)
+    if validators and output_path.exists():
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    # Stream into a sidecar and rename only once the body is complete, so a
+    # failure at any point (including before the first byte) leaves the
+    # previous good snapshot in place for the local-file parser.
+    part_path = output_path.with_name(output_path.name + ".part")
+    try:
+        async with client.stream("GET", url, headers=headers, timeout=timeout) as response:
+            if response.status_code == 304:
+                logger.info("[SUCCESS] '%s' unchanged (304), keeping %s", site["name"], output_path)
+                return True
+            response.raise_for_status()
+            total = 0
+            async with aiofiles.open(part_path, "wb") as f:
+                async for chunk in response.aiter_bytes(65536):
+                    await f.write(chunk)
+                    total += len(chunk)
+        part_path.replace(output_path)
+        if etag_index is not None:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                etag_index[url] = {"etag": etag, "last_modified": last_modified}
+        logger.info("[SUCCESS] Saved '%s' (%d bytes) to %s", site["name"], total, output_path)
+        return True
+    except httpx.HTTPStatusError as e:
+        logger.error("[ERROR] HTTP Error %d for %s: %s", e.response.status_code, url, e)
+    except httpx.RequestError as e:
+        logger.error("[ERROR] Request Error for %s: %s", url, e)
+    except Exception as e:
+        logger.error("[ERROR] Failed to save '%s': %s", site["name"], e)
+    # Only the partial download is discarded; output_path still holds the
+    # last successful snapshot, if any.
+    part_path.unlink(missing_ok=True)
     return False
 
 
-async def run_batch_prefetch():
+async def run_batch_prefetch(client: httpx.AsyncClient | None = None):
     """Automatically downloads all enabled data sources to the input folder."""
     config = config_manager.get_config()
     logging.info("Starting Automated Pre-Fetch of Enabled Sources...")
     today_str = date.today().strftime("%Y-%m-%d")
     SKIP_LIST = ["(DISABLED)", "IGNORE", "SKIP"]
-    adapter_source_ids = [adapter.source_id for adapter in Sources.ADAPTERS]
-
-    async with httpx.AsyncClient(follow_redirects=True, **build_httpx_client_kwargs()) as client:
-        prefetch_tasks = []
-        for category in config.get("LEGACY_DATA_SOURCES", []):  # Using legacy sources
-            logging.info(f"- Processing Category: {category['title']} -")
-            sites = [site for site in category.get("sites", []) if site.get("enabled", True)]
-            for site in sites:
-                site_name = site.get("name", "")
-                if any(skip_item in site_name for skip_item in SKIP_LIST):
-                    continue
-                if any(adapter_id in site_name.lower() for adapter_id in adapter_source_ids):
-                    continue
-                if site.get("url"):
-                    task = asyncio.create_task(prefetch_source(client, site, today_str))
-                    prefetch_tasks.append(task)
-        results = await asyncio.gather(*prefetch_tasks)
-        success_count = sum(1 for r in results if r)
-        logging.info(
-            f"Automated Pre-Fetch Complete. Success: {success_count}/{len(prefetch_tasks)}"
+    adapter_source_ids = list(Sources.ADAPTERS)
+    # One C-level regex scan per site instead of a Python loop over every
+    # skip keyword and adapter id for every name.
+    skip_re = re.compile("|".join(re.escape(s) for s in SKIP_LIST))
+    adapter_re = (
+        re.compile("|".join(re.escape(a) for a in adapter_source_ids))
+        if adapter_source_ids
+        else None
+    )
+
+    client = client or get_scanner_client()
+
+    # Bound the fan-out: a global cap keeps total sockets in check and a
+    # per-host cap (2) stops one origin being hammered by all its sites at
+    # once. Semaphores are created here so they bind to the running loop.
+    max_concurrency = config.get("HTTP_CLIENT", {}).get("MAX_CONCURRENCY", 8)
+    sem = asyncio.Semaphore(max_concurrency)
+    host_sems: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(2))
+
+    input_dir = Path(config["INPUT_DIR"])
+    input_dir.mkdir(exist_ok=True, parents=True)
+    etag_index = _load_etag_index(input_dir)
+
+    async def bounded_prefetch(site: Dict[str, Any]) -> bool:
+        host = urlparse(site["url"]).hostname or ""
+        async with sem, host_sems[host]:
+            return await prefetch_source(client, site, today_str, etag_index, input_dir)
+
+    # Group eligible sites by origin so each host's pages are scheduled
+    # together: with HTTP/2 they then multiplex onto the same connection
+    # instead of interleaving with unrelated hosts.
+    sites_by_host: Dict[str, List[Dict[str, Any]]] = {}
+    total = 0
+    for category in config.get("LEGACY_DATA_SOURCES", []):  # Using legacy sources
+        logger.info("- Processing Category: %s -", category["title"])
+        sites = [site for site in category.get("sites", []) if site.get("enabled", True)]
+        for site in sites:
+            site_name = site.get("name", "")
+            if skip_re.search(site_name):
+                continue
+            if adapter_re and adapter_re.search(site_name.lower()):
+                continue
+            if site.get("url"):
+                host = urlparse(site["url"]).hostname or ""
+                sites_by_host.setdefault(host, []).append(site)
+                total += 1
+
+    async def prefetch_origin(host_sites: List[Dict[str, Any]]) -> int:
+        results = await asyncio.gather(*(bounded_prefetch(site) for site in host_sites))
+        return sum(1 for r in results if r)
+
+    origin_tasks = [
+        asyncio.create_task(prefetch_origin(host_sites)) for host_sites in sites_by_host.values()
+    ]
+
+    # as_completed logs progress as origins finish instead of one summary
+    # after the slowest fetch, and lets finished task results be freed early.
+    success_count = 0
+    completed = 0
+    for future in asyncio.as_completed(origin_tasks):
+        success_count += await future
+        completed += 1
+        logger.info(
+            "Pre-Fetch progress: %d/%d origins (%d pages succeeded)",
+            completed,
+            len(origin_tasks),
+            success_count,
         )
+    await _save_etag_index(input_dir, etag_index)
+    logger.info("Automated Pre-Fetch Complete. Success: %d/%d", success_count, total)
 
 
 # --- Connection Testing Logic ---
-async def test_scanner_connections():
+async def test_scanner_connections(client: httpx.AsyncClient | None = None):
     """Tests all enabled scanner connections to ensure URLs are reachable."""
     config = config_manager.get_config()
     logging.info("Testing all enabled data source connections...")
     today_str = date.today().strftime("%Y-%m-%d")
     headers = config.get("StealthHeaders", {})
-    async with httpx.AsyncClient(headers=headers, **build_httpx_client_kwargs()) as client:
-        for category in config.get("LEGACY_DATA_SOURCES", []):
-            logging.info(f"- Testing Category: {category['title']} -")
-            sites = [site for site in category.get("sites", []) if site.get("enabled", True)]
-            for site in sites:
-                if site.get("url"):
-                    url = site["url"].format(date_str_iso=today_str)
-                    try:
-                        async with client.stream(
-                            "GET", url, timeout=15.0, follow_redirects=True
-                        ) as response:
-                            status_code = response.status_code
-                        if 200 <= status_code < 400:
-                            logging.info(f"[SUCCESS] ({status_code}) - {site['name']}")
-                        else:
-                            logging.warning(f"[WARNING] ({status_code}) - {site['name']} at {url}")
-                    except httpx.RequestError as e:
-                        logging.error(
-                            f"[ERROR] FAILED - {site['name']} at {url} ({type(e).__name__})"
-                        )
+    client = client or get_scanner_client()
+    for category in config.get("LEGACY_DATA_SOURCES", []):
+        logger.info("- Testing Category: %s -", category["title"])
+        sites = [site for site in category.get("sites", []) if site.get("enabled", True)]
+        for site in sites:
+            if site.get("url"):
+                url = _format_site_url(site["url"], today_str)
+                try:
+                    async with client.stream(
+                        "GET", url, headers=headers, timeout=15.0, follow_redirects=True
+                    ) as response:
+                        status_code = response.status_code
+                    if 200 <= status_code < 400:
+                        logger.info("[SUCCESS] (%d) - %s", status_code, site["name"])
+                    else:
+                        logger.warning("[WARNING] (%d) - %s at %s", status_code, site["name"], url)
+                except httpx.RequestError as e:
+                    logger.error(
+                        "[ERROR] FAILED - %s at %s (%s)", site["name"], url, type(e).__name__
+                    )
 
 
 # --- New scanner/discovery functions ---
@@ -1,8 +1,13 @@
 # fetching.py (refactored for config_manager)
 from __future__ import annotations
 import asyncio
+import logging
 import random
+import sys
 import time
+from functools import lru_cache
+from itertools import cycle
+from types import MappingProxyType
 import httpx
 from httpx import Cookies
 from typing import Optional, List, Dict
@@ -26,21 +31,63 @@ class BlockingDetectedError(FetchingError):
 
 _shared_async_client: Optional[httpx.AsyncClient] = None
 
+# Hosts observed downgrading from HTTP/2, logged once each so we know where
+# detail-page fan-out falls back to one-request-per-connection behaviour.
+_h2_downgraded_hosts: set[str] = set()
+
+
+def _check_http2(url: str, response: httpx.Response) -> None:
+    if response.http_version == "HTTP/2":
+        return
+    host = response.url.host
+    if host not in _h2_downgraded_hosts:
+        _h2_downgraded_hosts.add(host)
+        logging.info(
+            "Host %s negotiated %s; multiplexed detail fetches will not share one connection.",
+            host,
+            response.http_version,
+        )
+
+
+def _intern_header_map(headers: Dict[str, str]) -> MappingProxyType:
+    """
+    Interns the short, canonical header names/values so the per-request
+    dict merges in _base_headers hash and compare them by pointer identity
+    instead of re-hashing fresh strings from every config parse.
+    """
+    return MappingProxyType(
+        {
+            sys.intern(k): sys.intern(v) if isinstance(v, str) else v
+            for k, v in headers.items()
+        }
+    )
+
 
+@lru_cache(maxsize=1)
 def _get_config_sections():
-    """Helper to fetch all required config sections at once."""
+    """
+    Helper to fetch all required config sections at once. Every fetch path
+    calls this (often several times per request), so the section dict is
+    built once and invalidated on config reload rather than re-running
+    seven dict lookups per call. The cached sections are shared by every
+    caller, so the read-only ones are frozen (tuple / mappingproxy) to
+    guarantee no fetch path mutates another's view of the config.
+    """
     config = config_manager.get_config()
     return {
-        "HTTP_CLIENT": config.get("HTTP_CLIENT", {}),
-        "ScraperFeatures": config.get("ScraperFeatures", {}),
-        "Proxies": config.get("Proxies", {}),
-        "Fingerprints": config.get("Fingerprints", []),
-        "StealthHeaders": config.get("StealthHeaders", {}),
-        "CacheBustHeaders": config.get("CacheBustHeaders", {}),
-        "DNSResolvers": config.get("DNSResolvers", []),
+        "HTTP_CLIENT": MappingProxyType(config.get("HTTP_CLIENT", {})),
+        "ScraperFeatures": MappingProxyType(config.get("ScraperFeatures", {})),
+        "Proxies": MappingProxyType(config.get("Proxies", {})),
+        "Fingerprints": tuple(config.get("Fingerprints", [])),
+        "StealthHeaders": _intern_header_map(config.get("StealthHeaders", {})),
+        "CacheBustHeaders": _intern_header_map(config.get("CacheBustHeaders", {})),
+        "DNSResolvers": tuple(config.get("DNSResolvers", [])),
     }
 
 
+config_manager.register_invalidation_hook(_get_config_sections.cache_clear)
+
+
 def _pick_proxy() -> Optional[str]:
     cfg = _get_config_sections()
     proxy_cfg = cfg["Proxies"]
@@ -49,13 +96,29 @@ def _pick_proxy() -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=1)
+def _fingerprint_cycle():
+    """
+    Deterministic rotation over the configured fingerprints, built once and
+    rebuilt on config reload via the invalidation hook. Spreads fingerprints
+    evenly and avoids a random.choice per request.
+    """
+    fp_list = tuple(
+        _intern_header_map(fp) for fp in config_manager.get_config().get("Fingerprints", [])
+    )
+    return cycle(fp_list) if fp_list else None
+
+
+config_manager.register_invalidation_hook(_fingerprint_cycle.cache_clear)
+
+
 def _pick_fingerprint() -> Dict[str, str]:
     cfg = _get_config_sections()
     features_cfg = cfg["ScraperFeatures"]
-    fp_list = cfg["Fingerprints"]
-    if features_cfg.get("enable_fingerprint_rotation") and fp_list:
-        return random.choice(fp_list)
-    return {}
+    if not features_cfg.get("enable_fingerprint_rotation"):
+        return {}
+    fp_cycle = _fingerprint_cycle()
+    return next(fp_cycle) if fp_cycle is not None else {}
 
 
 def _base_headers(extra: Dict[str, str] | None = None) -> Dict[str, str]:
@@ -84,8 +147,17 @@ def get_shared_async_client(extra_headers: Dict[str, str] | None = None) -> http
             follow_redirects=bool(http_cfg.get("follow_redirects", True)),
             http2=bool(http_cfg.get("http2", True)),
             timeout=httpx.Timeout(15.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=http_cfg.get("max_connections", 100),
+                max_keepalive_connections=http_cfg.get("max_keepalive_connections", 20),
+                keepalive_expiry=http_cfg.get("keepalive_expiry_sec", 30.0),
+            ),
             proxies=_pick_proxy(),
             headers=_base_headers(extra_headers),
+            # Connect-level retries happen inside the transport, so a flaky
+            # DNS lookup or TCP handshake is re-tried without burning one of
+            # resilient_get's application-level attempts.
+            transport=httpx.AsyncHTTPTransport(retries=http_cfg.get("connect_retries", 1)),
         )
     return _shared_async_client
 
@@ -97,6 +169,21 @@ async def close_shared_async_client():
         _shared_async_client = None
 
 
+async def gather_limited(coros, concurrency: int, return_exceptions: bool = False):
+    """
+    Runs awaitables concurrently like asyncio.gather, but bounded by a
+    semaphore so an adapter fanning out over many race URLs cannot flood
+    the shared client with unbounded in-flight requests.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _run(coro):
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(_run(c) for c in coros), return_exceptions=return_exceptions)
+
+
 async def human_pause():
     cfg = _get_config_sections()
     http_cfg = cfg["HTTP_CLIENT"]
@@ -105,6 +192,42 @@ async def human_pause():
     )
 
 
+# Per-domain pacing state: (owning loop, lock, last-request monotonic time).
+# The lock serialises the read-sleep-update sequence so concurrent fetchers
+# queue behind each other instead of all reading the same stale timestamp
+# and bursting at the origin; time.monotonic() keeps the spacing immune to
+# wall-clock adjustments. Entries are rebuilt if a new event loop appears
+# (each menu action runs under its own asyncio.run), keeping the timestamp.
+_domain_state: Dict[str, tuple] = {}
+
+
+async def _reserve_domain_slot(url: str) -> None:
+    """
+    Waits until this request is allowed to hit the URL's domain, honouring
+    the configured min/max inter-request delay per domain rather than
+    sleeping unconditionally per call.
+    """
+    domain = httpx.URL(url).host or ""
+    loop = asyncio.get_running_loop()
+    entry = _domain_state.get(domain)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Lock(), entry[2] if entry else 0.0)
+        _domain_state[domain] = entry
+    _, lock, _ = entry
+
+    cfg = _get_config_sections()
+    http_cfg = cfg["HTTP_CLIENT"]
+    spacing = random.uniform(
+        http_cfg.get("min_delay_sec", 0.5), http_cfg.get("max_delay_sec", 2.0)
+    )
+    async with lock:
+        last = _domain_state[domain][2]
+        wait = spacing - (time.monotonic() - last)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        _domain_state[domain] = (loop, lock, time.monotonic())
+
+
 async def breadcrumb_get(
     urls: List[str], extra_headers: Dict[str, str] | None = None
 ) -> httpx.Response:
@@ -125,8 +248,70 @@ async def breadcrumb_get(
     return last
 
 
+# Validators + bodies from previous 200 responses, keyed by URL, so burst
+# re-fetches of unchanged list pages can be answered with a 304 and the
+# cached body instead of a full download + re-parse. The bound is on total
+# retained body bytes, not entry count: a thousand list pages can be a few
+# hundred megabytes, and the bodies are what actually cost memory. Eviction
+# is LRU — hits re-append their entry, so the front of the dict is always
+# the least recently used.
+_CONDITIONAL_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# A single page may not claim more than an eighth of the budget; anything
+# bigger is cheaper to re-download than to let it evict dozens of entries.
+_CONDITIONAL_CACHE_MAX_ENTRY_BYTES = _CONDITIONAL_CACHE_MAX_BYTES // 8
+_conditional_cache: Dict[str, Dict[str, object]] = {}
+_conditional_cache_bytes = 0
+
+
+def _store_validators(url: str, response: httpx.Response) -> None:
+    global _conditional_cache_bytes
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    size = len(response.content)
+    if size > _CONDITIONAL_CACHE_MAX_ENTRY_BYTES:
+        return
+    old = _conditional_cache.pop(url, None)
+    if old is not None:
+        _conditional_cache_bytes -= old["size"]
+    while _conditional_cache and _conditional_cache_bytes + size > _CONDITIONAL_CACHE_MAX_BYTES:
+        evicted = _conditional_cache.pop(next(iter(_conditional_cache)))
+        _conditional_cache_bytes -= evicted["size"]
+    _conditional_cache[url] = {
+        "etag": etag,
+        "last_modified": last_modified,
+        "response": response,
+        "size": size,
+    }
+    _conditional_cache_bytes += size
+
+
+def _touch_cached(url: str) -> None:
+    """Move a cache entry to the most-recently-used end after a 304 hit."""
+    entry = _conditional_cache.pop(url, None)
+    if entry is not None:
+        _conditional_cache[url] = entry
+
+
+# In-flight fetches keyed by URL so concurrent callers asking for the same
+# page share one request instead of racing duplicate GETs at the origin.
+_inflight: Dict[str, asyncio.Task] = {}
+
+
 async def resilient_get(
     url: str, extra_headers: Dict[str, str] | None = None, attempts: int = 4
+) -> httpx.Response:
+    task = _inflight.get(url)
+    if task is None:
+        task = asyncio.ensure_future(_resilient_get_once(url, extra_headers, attempts))
+        _inflight[url] = task
+        task.add_done_callback(lambda _t, _url=url: _inflight.pop(_url, None))
+    return await task
+
+
+async def _resilient_get_once(
+    url: str, extra_headers: Dict[str, str] | None = None, attempts: int = 4
 ) -> httpx.Response:
     client = get_shared_async_client()
     cfg = _get_config_sections()
@@ -134,13 +319,25 @@ async def resilient_get(
     delay = 1.0
     last_error = None
     for i in range(attempts):
-        await human_pause()
+        await _reserve_domain_slot(url)
         headers = _base_headers(extra_headers)
+        cached = _conditional_cache.get(url)
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
         try:
             r = await client.get(url, headers=headers)
+            _check_http2(url, r)
             if features_cfg.get("enable_timing_content_fingerprints"):
                 _monitor_response(url, r)
+            if r.status_code == 304 and cached:
+                logging.debug("Not modified, serving cached body for %s", url)
+                _touch_cached(url)
+                return cached["response"]
             if r.status_code == 200:
+                _store_validators(url, r)
                 return r
             r.raise_for_status()
         except httpx.HTTPStatusError as e:
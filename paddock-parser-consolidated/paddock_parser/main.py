@@ -9,14 +9,32 @@ integrating the V2 adapter pipeline and the V1 local file parser.
 
 import argparse
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from collections import defaultdict
+from functools import reduce
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-import nest_asyncio
+# nest_asyncio re-entrancy patching is only needed when an event loop is
+# already running (IPython/Jupyter); applied unconditionally it taxes every
+# task step of every pipeline. Outside notebooks, prefer uvloop's C event
+# loop when it's installed.
+if "ipykernel" in sys.modules or "IPython" in sys.modules:
+    import nest_asyncio
 
-nest_asyncio.apply()
+    nest_asyncio.apply()
+else:
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
 
 # --- Module Imports ---
 try:
@@ -37,6 +55,7 @@ try:
         merge_normalized_races,
         generate_paddock_reports,
     )
+    from .enhanced_scanner import close_scanner_client
     from .link_helper import create_and_launch_link_helper
     from .fetching import close_shared_async_client
     from .spectral_scheduler import run_bursts
@@ -57,14 +76,25 @@ except ImportError as e:
 
 
 def setup_logging(log_file: str):
-    """Configures logging for the application."""
+    """Configures logging for the application.
+
+    Handlers sit behind a QueueHandler/QueueListener pair so log records
+    are written by a background thread: concurrent fetch tasks enqueue and
+    move on instead of blocking the event loop on file/stderr flushes.
+    """
     log_dir = Path(log_file).parent
     log_dir.mkdir(exist_ok=True, parents=True)
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[logging.FileHandler(log_file, mode="w"), logging.StreamHandler(sys.stdout)],
-    )
+    handlers = [logging.FileHandler(log_file, mode="w"), logging.StreamHandler(sys.stdout)]
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
 
 
 def safe_async_run(coro, operation_name: str = "Operation"):
@@ -91,31 +121,30 @@ async def run_unified_pipeline(args: Optional[argparse.Namespace]):
     """
     print("\n--- Starting Unified Analysis Pipeline ---")
 
-    # 1. Get races from V2/V3 adapters
-    print("==> Phase 1: Fetching data from live adapters...")
-    races_from_adapters = await run_v2_adapter_pipeline()
-    print(f"==> Found {len(races_from_adapters)} races from live adapters.")
-
     # The V1 local file parser still needs the config dict for now.
     config = config_manager.get_config()
 
-    # 2. Get races from V1 local files
-    print("\n==> Phase 2: Parsing local HTML files...")
-    loop = asyncio.get_running_loop()
-    races_from_local = await loop.run_in_executor(None, parse_local_files, config, args)
+    # 1+2. Adapter fetching is network-bound and local parsing is
+    # disk/CPU-bound, so the two phases run concurrently: total wall time
+    # is max(t_adapters, t_local) instead of their sum.
+    print("==> Phases 1+2: Fetching live adapters and parsing local HTML files...")
+    races_from_adapters, races_from_local = await asyncio.gather(
+        run_v2_adapter_pipeline(),
+        asyncio.to_thread(parse_local_files, config, args),
+    )
+    print(f"==> Found {len(races_from_adapters)} races from live adapters.")
     print(f"==> Found {len(races_from_local)} races from local files.")
 
-    # 3. Merge the two lists of races
+    # 3. Merge the two lists of races. Grouping both sources by key first
+    # means each key is looked up once, and reduce folds each group through
+    # the same merge as before — adapter races stay first, so precedence is
+    # unchanged while the per-race membership-test/reassign dance goes away.
     print("\n==> Phase 3: Merging data from all sources...")
-    all_races_by_key: Dict[str, NormalizedRace] = {r.race_key: r for r in races_from_adapters}
-    for local_race in races_from_local:
-        if local_race.race_key in all_races_by_key:
-            existing = all_races_by_key[local_race.race_key]
-            all_races_by_key[local_race.race_key] = merge_normalized_races(existing, local_race)
-        else:
-            all_races_by_key[local_race.race_key] = local_race
+    grouped: Dict[str, List[NormalizedRace]] = defaultdict(list)
+    for race in chain(races_from_adapters, races_from_local):
+        grouped[race.race_key].append(race)
 
-    final_races = list(all_races_by_key.values())
+    final_races = [reduce(merge_normalized_races, group) for group in grouped.values()]
     if not final_races:
         print("✅ Analysis complete. No races found from any source.")
         return
@@ -189,63 +218,76 @@ def advanced_prefetch_menu_action():
 # =============================================================================
 
 
+def _print_config_summary(config):
+    print("\n--- Current Configuration (via ConfigManager) ---")
+    for key, value in config.items():
+        if isinstance(value, list):
+            print(f"- {key}: {len(value)} items")
+        elif isinstance(value, dict):
+            print(f"- {key}: {len(value)} keys")
+        else:
+            print(f"- {key}: {value}")
+    print("---------------------------")
+
+
 def main_menu():
     """Displays the action-oriented main menu for the user."""
     config = config_manager.get_config()
     app_name = config.get("APP_NAME", "Paddock Parser Toolkit")
 
+    # A handler table instead of an elif chain, so scripted runs (choices
+    # piped on stdin) dispatch through exactly the same actions. When stdin
+    # is not a tty the banner reprint and the return-to-menu pause are
+    # suppressed — they are pure terminal chatter on an automation run.
+    handlers = {
+        "1": lambda: safe_async_run(run_unified_pipeline(None), "Unified Analysis"),
+        "2": lambda: run_batch_parse(config, None),  # V1 module, still needs config
+        "3": lambda: run_persistent_engine(config, argparse.Namespace()),  # V1 module
+        "4": lambda: safe_async_run(run_batch_prefetch(), "Pre-Fetch"),  # V1 module
+        "5": lambda: create_and_launch_link_helper(config),  # V1 module
+        "6": lambda: safe_async_run(test_scanner_connections(), "Connection Test"),
+        "7": advanced_prefetch_menu_action,
+        "8": lambda: _print_config_summary(config),
+    }
+    interactive = sys.stdin.isatty()
+
     while True:
-        print("\n" + "=" * 60)
-        print(f" {app_name} v3.0 - Main Menu")
-        print("=" * 60)
-        print("--- Analysis ---")
-        print(" 1. Run Full Analysis (Live Adapters + Local Files)")
-        print(" 2. Parse Local Files Only")
-        print(" 3. Launch Live Paste Engine")
-        print()
-        print("--- Data Collection & Tools ---")
-        print(" 4. Pre-Fetch HTML Sources")
-        print(" 5. Open Manual Collection Helper")
-        print(" 6. Test All Source Connections")
-        print(" 7. Run Advanced Prefetch & Discovery")
-        print(" 8. View & Validate Configuration")
-        print()
-        print(" Q. Quit")
-        print("=" * 60)
-
-        choice = input("Enter your choice: ").strip().upper()
-
-        if choice == "1":
-            safe_async_run(run_unified_pipeline(None), "Unified Analysis")
-        elif choice == "2":
-            run_batch_parse(config, None)  # V1 module, still needs config
-        elif choice == "3":
-            run_persistent_engine(config, argparse.Namespace())  # V1 module
-        elif choice == "4":
-            safe_async_run(run_batch_prefetch(config), "Pre-Fetch")  # V1 module
-        elif choice == "5":
-            create_and_launch_link_helper(config)  # V1 module
-        elif choice == "6":
-            safe_async_run(test_scanner_connections(config), "Connection Test")  # V1 module
-        elif choice == "7":
-            advanced_prefetch_menu_action()
-        elif choice == "8":
-            print("\n--- Current Configuration (via ConfigManager) ---")
-            for key, value in config.items():
-                if isinstance(value, list):
-                    print(f"- {key}: {len(value)} items")
-                elif isinstance(value, dict):
-                    print(f"- {key}: {len(value.keys())} keys")
-                else:
-                    print(f"- {key}: {value}")
-            print("---------------------------")
-        elif choice == "Q":
+        if interactive:
+            print("\n" + "=" * 60)
+            print(f" {app_name} v3.0 - Main Menu")
+            print("=" * 60)
+            print("--- Analysis ---")
+            print(" 1. Run Full Analysis (Live Adapters + Local Files)")
+            print(" 2. Parse Local Files Only")
+            print(" 3. Launch Live Paste Engine")
+            print()
+            print("--- Data Collection & Tools ---")
+            print(" 4. Pre-Fetch HTML Sources")
+            print(" 5. Open Manual Collection Helper")
+            print(" 6. Test All Source Connections")
+            print(" 7. Run Advanced Prefetch & Discovery")
+            print(" 8. View & Validate Configuration")
+            print()
+            print(" Q. Quit")
+            print("=" * 60)
+
+        try:
+            choice = input("Enter your choice: " if interactive else "").strip().upper()
+        except EOFError:
+            # End of a piped choice script behaves like quitting.
+            break
+
+        if choice == "Q":
             print("👋 Goodbye!")
             break
+
+        handler = handlers.get(choice)
+        if handler:
+            handler()
         else:
             print("❌ Invalid choice, please try again.")
 
-        if choice != "Q":
+        if interactive:
             input("\nPress Enter to return to the menu...")
 
 
@@ -266,9 +308,9 @@ def main_cli(args: argparse.Namespace):
     elif args.command == "collect":
         create_and_launch_link_helper(config)  # V1 module
     elif args.command == "prefetch":
-        safe_async_run(run_batch_prefetch(config), "Pre-Fetch")  # V1 module
+        safe_async_run(run_batch_prefetch(), "Pre-Fetch")  # V1 module
     elif args.command == "test":
-        safe_async_run(test_scanner_connections(config), "Connection Test")  # V1 module
+        safe_async_run(test_scanner_connections(), "Connection Test")  # V1 module
     else:
         print(f"Unknown command: {args.command}")
         sys.exit(1)
@@ -341,3 +383,6 @@ if __name__ == "__main__":
         logging.critical(f"A fatal error occurred: {e}", exc_info=True)
         print(f"\n❌ A fatal error occurred: {e}")
         sys.exit(1)
+    finally:
+        # Release the scanner's pooled connections on the way out.
+        asyncio.run(close_scanner_client())
@@ -9,6 +9,7 @@ V2 introduces versioned, structured dataclasses for raw and normalized data.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 from .sources import RawRaceDocument
@@ -35,6 +36,14 @@ class NormalizedRunner:
     # Raw source-specific data for debugging and future use
     raw_data: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Shallow serialization-ready mapping. Unlike dataclasses.asdict, this
+        does not deep-copy nested containers, so it is only for immediate
+        JSON dumping, not for mutation.
+        """
+        return dict(self.__dict__)
+
 
 @dataclass
 class NormalizedRace:
@@ -54,25 +63,44 @@ class NormalizedRace:
     source_ids: List[str] = field(default_factory=list)
     extras: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Shallow serialization-ready mapping; runners are expanded one level
+        so the result round-trips through the JSON cache format. See
+        NormalizedRunner.to_dict for the copy-depth caveat.
+        """
+        return {**self.__dict__, "runners": [r.to_dict() for r in self.runners]}
+
 
 # --- KEY GENERATION ---
 
+# Precompiled patterns for the hot normalization path: these helpers run once
+# per runner per race across every adapter, so the patterns are compiled once
+# at module scope and the key functions memoized (track names and race times
+# repeat heavily across sources).
+_TRACK_STRIP_REGEX = re.compile(r"[^a-z0-9\s-]")
+_TRACK_JOIN_REGEX = re.compile(r"[\s-]+")
+_HHMM_REGEX = re.compile(r"(\d{1,2})[:.](\d{2})")
+_NON_DIGIT_REGEX = re.compile(r"[^0-9]")
 
+
+@lru_cache(maxsize=8192)
 def canonical_track_key(name: str) -> str:
     """Generates a standardized, URL-safe key for a racetrack."""
     if not name:
         return "unknown_track"
     # Lowercase, remove special chars, replace spaces with underscores
     name = name.lower().strip()
-    name = re.sub(r"[^a-z0-9\s-]", "", name)
-    name = re.sub(r"[\s-]+", "_", name)
+    name = _TRACK_STRIP_REGEX.sub("", name)
+    name = _TRACK_JOIN_REGEX.sub("_", name)
     return name
 
 
+@lru_cache(maxsize=8192)
 def canonical_race_key(track_key: str, race_time: str) -> str:
     """Generates a globally unique key for a race."""
     # Assumes race_time is already in HHMM format
-    time_str = re.sub(r"[^0-9]", "", race_time)
+    time_str = _NON_DIGIT_REGEX.sub("", race_time)
     return f"{track_key}::r{time_str}"
 
 
@@ -117,11 +145,16 @@ def map_discipline(discipline_name: str) -> str:
     return "thoroughbred"
 
 
+@lru_cache(maxsize=1024)
 def parse_hhmm_any(time_text: str) -> Optional[str]:
-    """Parses a time string into a standardized 24-hour 'HH:MM' format."""
+    """Parses a time string into a standardized 24-hour 'HH:MM' format.
+
+    The input domain is tiny (a few hundred distinct time strings per day),
+    so results are memoized to avoid re-running the regex for every row.
+    """
     if not time_text:
         return None
-    match = re.search(r"(\d{1,2})[:.](\d{2})", str(time_text))
+    match = _HHMM_REGEX.search(str(time_text))
     if not match:
         return None
     hour, minute = int(match.group(1)), int(match.group(2))
@@ -132,8 +165,13 @@ def parse_hhmm_any(time_text: str) -> Optional[str]:
     return f"{hour:02d}:{minute:02d}"
 
 
+@lru_cache(maxsize=8192)
 def convert_odds_to_decimal(odds_str: str) -> float | None:
-    """Converts various odds formats to a decimal float."""
+    """Converts various odds formats to a decimal float.
+
+    Odds strings like "5/2", "EVS" and "SP" repeat massively across runners,
+    so conversions are memoized.
+    """
     if not isinstance(odds_str, str) or not odds_str.strip():
         return None
     s = odds_str.strip().upper().replace("-", "/")
@@ -16,7 +16,7 @@ live sources and generating a report in the `output` directory.
 Requirements:
 - A `config_settings.json` file must be present in the same directory.
 - A `template_paddock.html` file must be present for report generation.
-- Dependencies: pip install nest_asyncio httpx beautifulsoup4 curl_cffi jinja2 tqdm pytz certifi
+- Dependencies: pip install nest_asyncio aiohttp beautifulsoup4 curl_cffi jinja2 tqdm pytz certifi
 """
 
 # =============================================================================
@@ -26,52 +26,103 @@ import argparse
 import asyncio
 import json
 import logging
+import os
 import random
 import re
+import ssl
 import sys
-import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import date
-from itertools import groupby
-from operator import attrgetter
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol, Type
 from urllib.parse import urlparse
 
-import nest_asyncio
-
 # Third-party imports - sorted alphabetically
 try:
+    import aiohttp
     import certifi
-    import httpx
     from jinja2 import Environment, FileSystemLoader, select_autoescape
 except ImportError as e:
     print(f"FATAL: Missing required dependency: {e.name}", file=sys.stderr)
     print(
-        "Please install requirements: pip install nest_asyncio httpx beautifulsoup4 curl_cffi jinja2 tqdm pytz certifi",
+        "Please install requirements: "
+        "pip install nest_asyncio aiohttp beautifulsoup4 curl_cffi jinja2 tqdm pytz certifi",
         file=sys.stderr,
     )
     sys.exit(1)
 
-nest_asyncio.apply()
+# nest_asyncio's loop patching disables the C-accelerated event loop paths,
+# so only apply it where re-entrant loops actually occur (notebooks, or an
+# embedding host that sets PADDOCK_NESTED_LOOP).
+if "ipykernel" in sys.modules or os.environ.get("PADDOCK_NESTED_LOOP"):
+    import nest_asyncio
+
+    nest_asyncio.apply()
+
+# uvloop is a drop-in libuv-backed loop that roughly doubles socket
+# throughput; install it when present, stay on the default loop otherwise.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
+# orjson parses the config several times faster than stdlib json; fall back
+# silently when it is not installed since the demo must stay portable.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# NumPy accelerates the scorer's odds maths on big cards; the pure-Python
+# path remains for installs without it.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 # =============================================================================
 # --- CONFIGURATION LOADER ---
 # =============================================================================
+# Parsed configs keyed by path; the (mtime_ns, size) stamp invalidates the
+# entry when the file changes, so repeat callers skip the JSON re-parse.
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
+
 def load_config(path: str = "config_settings.json") -> Dict[str, Any]:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        stat = os.stat(path)
     except FileNotFoundError:
         logging.error(f"Configuration file '{path}' not found. Using empty config.")
         return {}
-    except json.JSONDecodeError as e:
+
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        config = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError as e:
         logging.critical(f"FATAL: Could not parse config file '{path}': {e}.")
         sys.exit(1)
 
+    _CONFIG_CACHE[path] = (stamp, config)
+    return config
+
 
-_config = load_config()
+def get_config(path: str = "config_settings.json") -> Dict[str, Any]:
+    """Lazy accessor for the cached config; safe to call from anywhere."""
+    return load_config(path)
+
+
+_config = get_config()
 FINGERPRINTS = _config.get("FINGERPRINTS", [{"User-Agent": "Mozilla/5.0"}])
 STEALTH_HEADERS = _config.get("STEALTH_HEADERS", {})
 CACHE_BUST_HEADERS = _config.get("CACHE_BUST_HEADERS", {})
@@ -83,14 +134,14 @@ BIZ_HOURS = _config.get("BIZ_HOURS", {})
 ADAPTERS: List[Type["SourceAdapter"]] = []
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FieldConfidence:
     value: Any
     confidence: float
     source: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RunnerDoc:
     runner_id: str
     name: FieldConfidence
@@ -101,7 +152,7 @@ class RunnerDoc:
     extras: Dict[str, FieldConfidence] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RawRaceDocument:
     source_id: str
     fetched_at: str
@@ -112,7 +163,7 @@ class RawRaceDocument:
     extras: Dict[str, FieldConfidence] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NormalizedRunner:
     runner_id: str
     name: str
@@ -125,7 +176,7 @@ class NormalizedRunner:
     raw_data: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedRace:
     race_key: str
     track_key: str
@@ -135,9 +186,28 @@ class NormalizedRace:
     runners: List[NormalizedRunner] = field(default_factory=list)
     source_ids: List[str] = field(default_factory=list)
     extras: Dict[str, Any] = field(default_factory=dict)
+    _odds_columns: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
-
-@dataclass
+    def odds_columns(self) -> tuple:
+        """
+        Struct-of-arrays view of the card: (runners sorted by odds, odds
+        array sorted ascending). Computed once and cached on the race so
+        the scorer's passes never re-sort per call. The odds array is a
+        NumPy float64 vector when NumPy is available, else None.
+        """
+        if self._odds_columns is None:
+            with_odds = [r for r in self.runners if r.odds_decimal is not None]
+            if np is not None and with_odds:
+                odds = np.asarray([r.odds_decimal for r in with_odds], dtype=np.float64)
+                order = np.argsort(odds, kind="stable")
+                self._odds_columns = ([with_odds[i] for i in order], odds[order])
+            else:
+                with_odds.sort(key=lambda r: r.odds_decimal)
+                self._odds_columns = (with_odds, None)
+        return self._odds_columns
+
+
+@dataclass(slots=True, frozen=True)
 class ScoreResult:
     """Represents a race after scoring, ready for display."""
 
@@ -167,16 +237,26 @@ def register_adapter(cls: Type[SourceAdapter]) -> Type[SourceAdapter]:
 # =============================================================================
 # --- NORMALIZER FUNCTIONS ---
 # =============================================================================
+# Precompiled patterns + memoization for the per-runner hot path; track
+# names, race times and odds strings repeat heavily across sources.
+_TRACK_STRIP_REGEX = re.compile(r"[^a-z0-9\s-]")
+_TRACK_JOIN_REGEX = re.compile(r"[\s-]+")
+_HHMM_REGEX = re.compile(r"(\d{1,2})[:.](\d{2})")
+_NON_DIGIT_REGEX = re.compile(r"[^0-9]")
+
+
+@lru_cache(maxsize=8192)
 def canonical_track_key(name: str) -> str:
     if not name:
         return "unknown_track"
     name = name.lower().strip()
-    name = re.sub(r"[^a-z0-9\s-]", "", name)
-    return re.sub(r"[\s-]+", "_", name)
+    name = _TRACK_STRIP_REGEX.sub("", name)
+    return _TRACK_JOIN_REGEX.sub("_", name)
 
 
+@lru_cache(maxsize=8192)
 def canonical_race_key(track_key: str, race_time: str) -> str:
-    return f"{track_key}::r{re.sub(r'[^0-9]', '', race_time)}"
+    return f"{track_key}::r{_NON_DIGIT_REGEX.sub('', race_time)}"
 
 
 def normalize_course_name(name: str) -> str:
@@ -193,10 +273,11 @@ def map_discipline(discipline_name: str) -> str:
     return "thoroughbred"
 
 
+@lru_cache(maxsize=1024)
 def parse_hhmm_any(time_text: str) -> Optional[str]:
     if not time_text:
         return None
-    match = re.search(r"(\d{1,2})[:.](\d{2})", str(time_text))
+    match = _HHMM_REGEX.search(str(time_text))
     if not match:
         return None
     hour, minute = int(match.group(1)), int(match.group(2))
@@ -207,6 +288,7 @@ def parse_hhmm_any(time_text: str) -> Optional[str]:
     return f"{hour:02d}:{minute:02d}"
 
 
+@lru_cache(maxsize=8192)
 def convert_odds_to_decimal(odds_str: str) -> Optional[float]:
     if not isinstance(odds_str, str) or not odds_str.strip():
         return None
@@ -259,46 +341,152 @@ class BlockingDetectedError(FetchingError):
     pass
 
 
-_shared_async_client: Optional[httpx.AsyncClient] = None
-_request_history: Dict[str, float] = {}
+@dataclass
+class FetchResponse:
+    """
+    A minimal response object returned by `resilient_get`.
 
+    It carries the fully-read body so callers can keep using the familiar
+    `.text`/`.content` attributes regardless of the underlying HTTP library.
+    """
 
-def get_shared_async_client(fresh_session: bool = False) -> httpx.AsyncClient:
-    global _shared_async_client
-    if _shared_async_client is None or _shared_async_client.is_closed or fresh_session:
-        if _shared_async_client and not _shared_async_client.is_closed:
-            asyncio.create_task(_shared_async_client.aclose())
+    url: str
+    status_code: int
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+
+_shared_aiohttp_session: Optional[aiohttp.ClientSession] = None
+_next_allowed: Dict[str, float] = {}
+_next_allowed_locks: Dict[str, asyncio.Lock] = {}
+_host_sems: Dict[str, asyncio.Semaphore] = {}
+
+
+async def _reserve_request_slot(domain: str, min_delay: float) -> None:
+    """
+    Reserves the next allowed request time for a domain and waits for it.
+
+    Each caller atomically claims its own non-overlapping slot on a
+    monotonically advancing per-domain timeline, then sleeps outside the
+    lock — so concurrent callers are throttled correctly without being
+    serialized behind each other's sleeps.
+    """
+    loop = asyncio.get_running_loop()
+    lock = _next_allowed_locks.setdefault(domain, asyncio.Lock())
+    async with lock:
+        now = loop.time()
+        slot = max(now, _next_allowed.get(domain, 0.0))
+        _next_allowed[domain] = slot + min_delay
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+
+# Sessions displaced by a fresh_session request; closed alongside the live
+# session by close_shared_async_client, so none can outlive the pipeline.
+_retired_sessions: List[aiohttp.ClientSession] = []
+
+
+def get_shared_async_client(fresh_session: bool = False) -> aiohttp.ClientSession:
+    global _shared_aiohttp_session
+    if _shared_aiohttp_session is None or _shared_aiohttp_session.closed or fresh_session:
+        if _shared_aiohttp_session and not _shared_aiohttp_session.closed:
+            _retired_sessions.append(_shared_aiohttp_session)
         headers = random.choice(FINGERPRINTS).copy()
-        _shared_async_client = httpx.AsyncClient(
-            follow_redirects=True, timeout=30.0, headers=headers, verify=certifi.where()
+        # Explicit pool caps: keep sockets alive between bursts so the
+        # 2nd..Nth request to a host reuses a warm connection instead of
+        # paying a fresh TCP+TLS handshake.
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            keepalive_timeout=30.0,
+            ttl_dns_cache=300,
+            ssl=ssl.create_default_context(cafile=certifi.where()),
         )
-        logging.info("Initialized new shared httpx client")
-    return _shared_async_client
+        _shared_aiohttp_session = aiohttp.ClientSession(
+            connector=connector,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=30.0),
+        )
+        logging.info("Initialized new shared aiohttp session")
+    return _shared_aiohttp_session
+
+
+async def close_shared_async_client() -> None:
+    """Closes the shared session and any retired ones; safe to call when no
+    session was ever opened."""
+    global _shared_aiohttp_session
+    sessions = _retired_sessions + [_shared_aiohttp_session]
+    _retired_sessions.clear()
+    _shared_aiohttp_session = None
+    for session in sessions:
+        if session is not None and not session.closed:
+            await session.close()
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Cached hostname extraction; race URLs repeat across retries and scans."""
+    return urlparse(url).netloc
+
+
+# Fully merged header sets per (stealth, cache-bust) flag pair, composed
+# once so each request picks a ready dict instead of copy+update-ing the
+# same three layers every attempt.
+_composed_fingerprints: Dict[tuple, List[Dict[str, str]]] = {}
+
+
+def _pick_composed_headers(stealth: bool, cache_bust: bool) -> Dict[str, str]:
+    key = (stealth, cache_bust)
+    composed = _composed_fingerprints.get(key)
+    if composed is None:
+        composed = []
+        for fp in FINGERPRINTS:
+            headers = fp.copy()
+            if stealth:
+                headers.update(STEALTH_HEADERS)
+            if cache_bust:
+                headers.update(CACHE_BUST_HEADERS)
+            composed.append(headers)
+        _composed_fingerprints[key] = composed
+    return random.choice(composed)
 
 
-async def resilient_get(url: str, config: dict, attempts: int = 3) -> httpx.Response:
+async def resilient_get(url: str, config: dict, attempts: int = 3) -> FetchResponse:
     scraper_config = config.get("SCRAPER", {})
     min_delay = scraper_config.get("MIN_REQUEST_DELAY", 1.0)
-    domain = urlparse(url).netloc
-    if domain in _request_history and (time.time() - _request_history[domain]) < min_delay:
-        await asyncio.sleep(min_delay - (time.time() - _request_history[domain]))
-    _request_history[domain] = time.time()
+    domain = _netloc(url)
+    await _reserve_request_slot(domain, min_delay)
+
+    # Bound concurrent in-flight requests per host: an adapter iterating N
+    # races must not open N sockets at once and defeat keep-alive reuse.
+    sem = _host_sems.setdefault(
+        domain, asyncio.Semaphore(scraper_config.get("MAX_CONCURRENCY_PER_HOST", 64))
+    )
 
-    client = get_shared_async_client()
+    session = get_shared_async_client()
+    stealth = bool(scraper_config.get("ENABLE_STEALTH_HEADERS"))
+    cache_bust = bool(scraper_config.get("ENABLE_CACHE_BUST"))
     for attempt in range(attempts):
         try:
-            headers = random.choice(FINGERPRINTS).copy()
-            if scraper_config.get("ENABLE_STEALTH_HEADERS"):
-                headers.update(STEALTH_HEADERS)
-            if scraper_config.get("ENABLE_CACHE_BUST"):
-                headers.update(CACHE_BUST_HEADERS)
-
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            return response
+            headers = _pick_composed_headers(stealth, cache_bust)
+
+            async with sem:
+                async with session.get(url, headers=headers) as response:
+                    response.raise_for_status()
+                    content = await response.read()
+                    return FetchResponse(
+                        url=str(response.url),
+                        status_code=response.status,
+                        content=content,
+                        headers=dict(response.headers),
+                    )
         except Exception as e:
             logging.warning(f"Fetch attempt {attempt + 1} for {url} failed: {e}")
-            client = get_shared_async_client(fresh_session=True)
+            session = get_shared_async_client(fresh_session=True)
             await asyncio.sleep((attempt + 1) * 2)
     raise FetchingError(f"Failed to fetch {url} after {attempts} attempts.")
 
@@ -430,11 +618,14 @@ class V2Scorer:
             return 50.0
         return 30.0
 
-    def _get_fav_vs_field_ratio_score(self, runners: list) -> tuple[float, float]:
+    def _get_fav_vs_field_ratio_score(self, runners: list, odds_arr=None) -> tuple[float, float]:
         if len(runners) < 3:
             return 20.0, 0.0
         fav_odds = runners[0].odds_decimal
-        avg_odds = sum(r.odds_decimal for r in runners) / len(runners)
+        if odds_arr is not None:
+            avg_odds = float(odds_arr.mean())
+        else:
+            avg_odds = sum(r.odds_decimal for r in runners) / len(runners)
         if avg_odds == 0:
             return 0.0, 0.0
         ratio = fav_odds / avg_odds
@@ -498,9 +689,7 @@ class V2Scorer:
 
     def score_race(self, race: NormalizedRace) -> ScoreResult:
         """Calculates a score for a single normalized race."""
-        runners_with_odds = sorted(
-            [r for r in race.runners if r.odds_decimal is not None], key=lambda r: r.odds_decimal
-        )
+        runners_with_odds, odds_arr = race.odds_columns()
 
         if len(runners_with_odds) < 2:
             return ScoreResult(race=race, score=0.0, reason="Not enough runners with odds.")
@@ -515,7 +704,7 @@ class V2Scorer:
         field_size_score = self._get_field_size_score(field_size)
         fav_odds_score = self._get_fav_odds_score(fav_odds)
         spread_score = self._get_odds_spread_score(fav_odds, sec_fav_odds)
-        fav_ratio_score, fav_ratio = self._get_fav_vs_field_ratio_score(runners_with_odds)
+        fav_ratio_score, fav_ratio = self._get_fav_vs_field_ratio_score(runners_with_odds, odds_arr)
 
         final_score = (
             (field_size_score * self.weights["FIELD_SIZE"])
@@ -542,11 +731,31 @@ class V2Scorer:
         )
 
 
+# Worker pool for the CPU-bound normalize/score stages, created on first
+# use so merely importing the demo never forks processes.
+_PROCESS_POOL_THRESHOLD = 8
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    return _process_pool
+
+
 def score_races(races: List[NormalizedRace], config: Dict) -> List[ScoreResult]:
     scorer = V2Scorer(config)
     return sorted([scorer.score_race(race) for race in races], key=lambda r: r.score, reverse=True)
 
 
+def _public_fields(items) -> Dict[str, Any]:
+    """asdict dict_factory that drops underscore-private fields: the race's
+    _odds_columns cache holds a NumPy array, which would otherwise land in
+    the JSON report and make json.dump raise."""
+    return {k: v for k, v in items if not k.startswith("_")}
+
+
 def generate_paddock_reports(scored_results: List[ScoreResult], config: Dict):
     """
     Generates JSON and HTML reports from a list of scored race results.
@@ -559,7 +768,8 @@ def generate_paddock_reports(scored_results: List[ScoreResult], config: Dict):
     json_path = output_dir / f"paddock_report_v2_{today_str}.json"
     try:
         with open(json_path, "w", encoding="utf-8") as f:
-            json.dump([asdict(res) for res in scored_results], f, indent=2)
+            serializable = [asdict(res, dict_factory=_public_fields) for res in scored_results]
+            json.dump(serializable, f, indent=2)
         logging.info(f"V2 JSON report saved to {json_path}")
     except Exception as e:
         logging.error(f"Failed to save V2 JSON report: {e}")
@@ -578,49 +788,70 @@ def generate_paddock_reports(scored_results: List[ScoreResult], config: Dict):
 
 async def run_unified_pipeline(config: Dict, args: Optional[argparse.Namespace]):
     logging.info("--- Starting Unified Analysis Pipeline ---")
-    enabled_adapters = [
-        adapter(config)
-        for adapter in ADAPTERS
-        if adapter(config).site_config and adapter(config).site_config.get("enabled")
-    ]
-    adapter_results = await asyncio.gather(
-        *(adapter.fetch() for adapter in enabled_adapters), return_exceptions=True
-    )
-    raw_docs = [doc for res in adapter_results if isinstance(res, list) for doc in res]
-
-    races_by_key = {
-        key: list(group)
-        for key, group in groupby(
-            sorted(raw_docs, key=attrgetter("race_key")), key=attrgetter("race_key")
-        )
-    }
-    normalized_races = [
-        normalize_race_docs(docs[0]) for docs in races_by_key.values()
-    ]  # Simplified merge
-
-    scored_results = score_races(normalized_races, config)
-
-    print(f"Displaying top {len(scored_results)} scored races:")
-    for result in scored_results:
-        print("-" * 50)
-        print(f"Race: {result.race.race_key} (Score: {result.score})")
-        if result.best_value_score is not None:
-            print(f"  Value Score: {result.best_value_score} ({result.best_value_reason})")
-        print(f"  Reason: {result.reason}")
-        print(f"  Start Time: {result.race.start_time_iso}")
-        print(f"  Sources: {', '.join(result.race.source_ids)}")
-        print(f"  Runners ({len(result.race.runners)}):")
-        sorted_runners = sorted(
-            result.race.runners,
-            key=lambda r: int(r.saddle_cloth) if r.saddle_cloth.isdigit() else 999,
+    # The shared session must not outlive the loop asyncio.run() is
+    # about to tear down, or aiohttp warns about unclosed sessions on
+    # every demo exit.
+    try:
+        enabled_adapters = [
+            adapter(config)
+            for adapter in ADAPTERS
+            if adapter(config).site_config and adapter(config).site_config.get("enabled")
+        ]
+        adapter_results = await asyncio.gather(
+            *(adapter.fetch() for adapter in enabled_adapters), return_exceptions=True
         )
-        for runner in sorted_runners:
-            odds = f"{runner.odds_decimal:.2f}" if runner.odds_decimal else "N/A"
-            print(f"    - {runner.saddle_cloth}. {runner.name} ({odds})")
-
-    # Also generate the reports
-    generate_paddock_reports(scored_results, config)
-    print("✅ Unified analysis pipeline complete.")
+        raw_docs = [doc for res in adapter_results if isinstance(res, list) for doc in res]
+
+        # Bucket docs by race_key in one O(n) pass; the old sort+groupby pairing
+        # spent O(n log n) ordering keys we never needed sorted.
+        races_by_key: Dict[str, list] = {}
+        for doc in raw_docs:
+            races_by_key.setdefault(doc.race_key, []).append(doc)
+
+        # Normalising and scoring are pure CPU work, so on a big haul they run
+        # in worker processes and keep the event loop free for the next fetch
+        # burst. Small hauls stay inline: pickling would cost more than it saves.
+        if len(races_by_key) >= _PROCESS_POOL_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            pool = _get_process_pool()
+            normalized_races = list(
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(pool, normalize_race_docs, docs[0])
+                        for docs in races_by_key.values()
+                    )
+                )
+            )  # Simplified merge
+            scored_results = await loop.run_in_executor(pool, score_races, normalized_races, config)
+        else:
+            normalized_races = [
+                normalize_race_docs(docs[0]) for docs in races_by_key.values()
+            ]  # Simplified merge
+            scored_results = score_races(normalized_races, config)
+
+        print(f"Displaying top {len(scored_results)} scored races:")
+        for result in scored_results:
+            print("-" * 50)
+            print(f"Race: {result.race.race_key} (Score: {result.score})")
+            if result.best_value_score is not None:
+                print(f"  Value Score: {result.best_value_score} ({result.best_value_reason})")
+            print(f"  Reason: {result.reason}")
+            print(f"  Start Time: {result.race.start_time_iso}")
+            print(f"  Sources: {', '.join(result.race.source_ids)}")
+            print(f"  Runners ({len(result.race.runners)}):")
+            sorted_runners = sorted(
+                result.race.runners,
+                key=lambda r: int(r.saddle_cloth) if r.saddle_cloth.isdigit() else 999,
+            )
+            for runner in sorted_runners:
+                odds = f"{runner.odds_decimal:.2f}" if runner.odds_decimal else "N/A"
+                print(f"    - {runner.saddle_cloth}. {runner.name} ({odds})")
+
+        # Also generate the reports
+        generate_paddock_reports(scored_results, config)
+        print("✅ Unified analysis pipeline complete.")
+    finally:
+        await close_shared_async_client()
 
 
 # =============================================================================
@@ -628,7 +859,7 @@ async def run_unified_pipeline(config: Dict, args: Optional[argparse.Namespace])
 # =============================================================================
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
-    main_config = load_config()
+    main_config = get_config()
     if not main_config:
         sys.exit("Could not load configuration. Exiting.")
 
@@ -2,11 +2,12 @@ import logging
 from typing import Protocol, List, Dict, Any, Type
 from dataclasses import dataclass, field
 
-# A global registry for all adapters
-ADAPTERS: List[Type["SourceAdapter"]] = []
+# A global registry for all adapters, keyed by source_id for O(1) lookup
+# and duplicate detection.
+ADAPTERS: Dict[str, Type["SourceAdapter"]] = {}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FieldConfidence:
     """Holds a value and our confidence in its accuracy."""
 
@@ -15,7 +16,7 @@ class FieldConfidence:
     source: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RunnerDoc:
     """A document representing a single runner in a race."""
 
@@ -28,7 +29,7 @@ class RunnerDoc:
     extras: Dict[str, FieldConfidence] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class RawRaceDocument:
     """
     A raw, unprocessed document for a single race from a specific source.
@@ -70,7 +71,18 @@ def register_adapter(cls: Type[SourceAdapter]) -> Type[SourceAdapter]:
     if not hasattr(cls, "source_id"):
         raise TypeError(f"Adapter {cls.__name__} must have a 'source_id' attribute.")
 
-    if cls not in ADAPTERS:
+    existing = ADAPTERS.get(cls.source_id)
+    if existing is not None and existing is not cls:
+        logging.warning(
+            f"Duplicate adapter registration for source '{cls.source_id}': "
+            f"{cls.__name__} replaces {existing.__name__}"
+        )
+    elif existing is None:
         logging.info(f"Registering adapter: {cls.__name__} for source '{cls.source_id}'")
-        ADAPTERS.append(cls)
+    ADAPTERS[cls.source_id] = cls
     return cls
+
+
+def list_adapters() -> List[Type[SourceAdapter]]:
+    """Returns the registered adapter classes, for callers that iterate."""
+    return list(ADAPTERS.values())
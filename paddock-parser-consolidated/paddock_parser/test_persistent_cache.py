@@ -0,0 +1,114 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from .normalizer import NormalizedRace, NormalizedRunner
+from .paddock_parser import (
+    _append_journal,
+    _flush_full_cache,
+    _restore_cache,
+    merge_normalized_races,
+)
+
+
+def _race(key: str, odds: float) -> NormalizedRace:
+    return NormalizedRace(
+        race_key=key,
+        track_key=key.split("|")[0],
+        start_time_iso="2026-08-27T14:30:00",
+        runners=[
+            NormalizedRunner(
+                runner_id=f"{key}-1", name="Alpha", saddle_cloth="1", odds_decimal=odds
+            ),
+            NormalizedRunner(
+                runner_id=f"{key}-2", name="Beta", saddle_cloth="2", odds_decimal=odds + 2.0
+            ),
+        ],
+        source_ids=["test"],
+    )
+
+
+def _fav_odds(race: NormalizedRace) -> float:
+    return race.runners[0].odds_decimal
+
+
+class TestPersistentCacheReplay(unittest.TestCase):
+    """
+    Covers the persistence path of the engine: full atomic flushes, JSONL
+    journal appends for per-paste deltas, and restore-time replay where the
+    last journal record per race_key wins.
+    """
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.cache_file = self.tmp / "paddock_cache_v2_test.json"
+        self.journal_file = self.cache_file.with_suffix(".jsonl")
+
+    def test_full_flush_round_trips_and_truncates_journal(self):
+        self.journal_file.write_bytes(b'{"stale": true}\n')
+        races = {"ascot|1430": _race("ascot|1430", 2.5), "york|1500": _race("york|1500", 3.0)}
+        _flush_full_cache(self.cache_file, self.journal_file, races)
+
+        self.assertFalse(self.journal_file.exists(), "flush must truncate the journal")
+        restored = _restore_cache(self.cache_file, self.journal_file)
+        self.assertEqual(set(restored), {"ascot|1430", "york|1500"})
+        self.assertEqual(_fav_odds(restored["ascot|1430"]), 2.5)
+
+    def test_journal_replays_on_top_of_cache_last_record_wins(self):
+        races = {"ascot|1430": _race("ascot|1430", 2.5)}
+        _flush_full_cache(self.cache_file, self.journal_file, races)
+
+        # Two pastes after the flush: one updates the cached race twice, one
+        # introduces a race the compacted cache has never seen.
+        races["ascot|1430"] = _race("ascot|1430", 2.8)
+        _append_journal(self.journal_file, races, {"ascot|1430"})
+        races["ascot|1430"] = _race("ascot|1430", 3.2)
+        races["york|1500"] = _race("york|1500", 4.0)
+        _append_journal(self.journal_file, races, {"ascot|1430", "york|1500"})
+
+        restored = _restore_cache(self.cache_file, self.journal_file)
+        self.assertEqual(set(restored), {"ascot|1430", "york|1500"})
+        self.assertEqual(_fav_odds(restored["ascot|1430"]), 3.2, "last journal record must win")
+        self.assertEqual(_fav_odds(restored["york|1500"]), 4.0)
+
+    def test_restored_races_flush_and_merge_again(self):
+        """A restored cache must survive the next flush and the next merge.
+
+        Restored runners are rehydrated into NormalizedRunner, so the
+        engine's periodic/shutdown flush (to_dict per runner) and a paste
+        merged on top of a restored race both work in the same session.
+        """
+        races = {"ascot|1430": _race("ascot|1430", 2.5)}
+        _flush_full_cache(self.cache_file, self.journal_file, races)
+        restored = _restore_cache(self.cache_file, self.journal_file)
+
+        for runner in restored["ascot|1430"].runners:
+            self.assertIsInstance(runner, NormalizedRunner)
+
+        # Flush-after-restore: this raised AttributeError when restored
+        # runners were left as plain dicts.
+        _flush_full_cache(self.cache_file, self.journal_file, restored)
+        again = _restore_cache(self.cache_file, self.journal_file)
+        self.assertEqual(_fav_odds(again["ascot|1430"]), 2.5)
+
+        # Merge-after-restore reads runner attributes on the restored side.
+        merged = merge_normalized_races(again["ascot|1430"], _race("ascot|1430", 2.8))
+        self.assertEqual(merged.race_key, "ascot|1430")
+
+    def test_truncated_journal_keeps_entries_replayed_so_far(self):
+        races = {"ascot|1430": _race("ascot|1430", 2.5)}
+        _flush_full_cache(self.cache_file, self.journal_file, races)
+        races["ascot|1430"] = _race("ascot|1430", 3.2)
+        _append_journal(self.journal_file, races, {"ascot|1430"})
+        # Simulate a crash mid-append: a half-written trailing record.
+        with open(self.journal_file, "ab") as f:
+            f.write(b'{"race_key": "york|15')
+
+        with self.assertLogs(level="WARNING"):
+            restored = _restore_cache(self.cache_file, self.journal_file)
+        self.assertEqual(set(restored), {"ascot|1430"})
+        self.assertEqual(_fav_odds(restored["ascot|1430"]), 3.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
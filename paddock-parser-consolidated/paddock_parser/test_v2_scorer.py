@@ -32,6 +32,13 @@ class TestV2Scorer(unittest.TestCase):
         # V3: Scorer now uses the global config manager, so no config is passed.
         self.scorer = V2Scorer()
 
+    @staticmethod
+    def _ratio_args(runners):
+        """Derives the (fav_odds, avg_odds, n) inputs the ratio scorer takes."""
+        fav_odds = min(r.odds_decimal for r in runners)
+        avg_odds = sum(r.odds_decimal for r in runners) / len(runners)
+        return fav_odds, avg_odds, len(runners)
+
     def test_fav_vs_field_ratio_score_strong_favorite(self):
         """
         Test with a strong favorite (e.g., 1.5 odds) against a field of outsiders.
@@ -39,7 +46,7 @@ class TestV2Scorer(unittest.TestCase):
         """
         runners = [MockRunner(1.5), MockRunner(5.0), MockRunner(8.0), MockRunner(12.0)]
         expected_score = 40.0
-        score, ratio = self.scorer._get_fav_vs_field_ratio_score(runners)
+        score, ratio = self.scorer._get_fav_vs_field_ratio_score(*self._ratio_args(runners))
         self.assertEqual(score, expected_score)
         self.assertAlmostEqual(ratio, 0.226, places=3)
 
@@ -50,7 +57,7 @@ class TestV2Scorer(unittest.TestCase):
         """
         runners = [MockRunner(3.5), MockRunner(4.0), MockRunner(5.0), MockRunner(6.0)]
         expected_score = 90.0
-        score, ratio = self.scorer._get_fav_vs_field_ratio_score(runners)
+        score, ratio = self.scorer._get_fav_vs_field_ratio_score(*self._ratio_args(runners))
         self.assertEqual(score, expected_score)
         self.assertAlmostEqual(ratio, 0.757, places=3)
 
@@ -61,7 +68,7 @@ class TestV2Scorer(unittest.TestCase):
         """
         runners = [MockRunner(4.0), MockRunner(4.5), MockRunner(5.0), MockRunner(5.5)]
         expected_score = 100.0
-        score, ratio = self.scorer._get_fav_vs_field_ratio_score(runners)
+        score, ratio = self.scorer._get_fav_vs_field_ratio_score(*self._ratio_args(runners))
         self.assertEqual(score, expected_score)
         self.assertAlmostEqual(ratio, 0.842, places=3)
 
@@ -72,7 +79,7 @@ class TestV2Scorer(unittest.TestCase):
         """
         runners = [MockRunner(2.0), MockRunner(3.0)]
         expected_score = 20.0
-        score, ratio = self.scorer._get_fav_vs_field_ratio_score(runners)
+        score, ratio = self.scorer._get_fav_vs_field_ratio_score(*self._ratio_args(runners))
         self.assertEqual(score, expected_score)
         self.assertEqual(ratio, 0.0)
 
@@ -0,0 +1,102 @@
+import random
+import unittest
+
+from .analysis import V2Scorer
+from .normalizer import NormalizedRace, NormalizedRunner
+
+# Odds are drawn half from the scoring band edges and half uniformly, so the
+# boundary conditions (spread exactly 0.5, ratio exactly 0.7, value odds
+# exactly 5.0, ...) are hit as often as the interiors of the bands.
+_EDGE_ODDS = [1.5, 2.5, 3.0, 4.0, 5.0, 6.0, 10.0, 15.0]
+
+
+def _make_race(rng: random.Random, idx: int) -> NormalizedRace:
+    """Builds a race with a random field; some runners carry no odds."""
+    runners = []
+    for j in range(rng.randint(0, 14)):
+        if rng.random() < 0.15:
+            odds = None
+        elif rng.random() < 0.5:
+            odds = rng.choice(_EDGE_ODDS)
+        else:
+            odds = round(rng.uniform(1.1, 30.0), 2)
+        runners.append(
+            NormalizedRunner(
+                runner_id=f"r{idx}-{j}",
+                name=f"Horse {j}",
+                saddle_cloth=str(j + 1),
+                odds_decimal=odds,
+            )
+        )
+    return NormalizedRace(
+        race_key=f"track_{idx}|1430",
+        track_key=f"track_{idx}",
+        start_time_iso="2026-08-27T14:30:00",
+        runners=runners,
+    )
+
+
+class TestBatchScoringParity(unittest.TestCase):
+    """
+    score_race is the scalar reference implementation; score_batch must stay
+    in lockstep with it field for field, whichever backend (NumPy or the
+    Numba kernel) happens to be installed.
+    """
+
+    def setUp(self):
+        self.scorer = V2Scorer()
+
+    def test_batch_matches_scalar_on_random_races(self):
+        rng = random.Random(20260827)
+        races = [_make_race(rng, i) for i in range(400)]
+
+        scalar = [self.scorer.score_race(race) for race in races]
+        batch = self.scorer.score_batch(races)
+
+        self.assertEqual(len(scalar), len(batch))
+        for s, b in zip(scalar, batch):
+            self.assertIs(s.race, b.race)
+            self.assertEqual(s.score, b.score, s.race.race_key)
+            self.assertEqual(s.reason, b.reason, s.race.race_key)
+            self.assertEqual(s.best_value_score, b.best_value_score, s.race.race_key)
+            self.assertEqual(s.best_value_reason, b.best_value_reason, s.race.race_key)
+
+    def test_batch_handles_degenerate_fields(self):
+        """Empty card, one runner with odds, and an all-None-odds field."""
+        races = [
+            NormalizedRace(
+                race_key="empty|1400",
+                track_key="empty",
+                start_time_iso="2026-08-27T14:00:00",
+            ),
+            NormalizedRace(
+                race_key="solo|1500",
+                track_key="solo",
+                start_time_iso="2026-08-27T15:00:00",
+                runners=[
+                    NormalizedRunner(
+                        runner_id="s1", name="Solo", saddle_cloth="1", odds_decimal=2.0
+                    )
+                ],
+            ),
+            NormalizedRace(
+                race_key="noodds|1530",
+                track_key="noodds",
+                start_time_iso="2026-08-27T15:30:00",
+                runners=[
+                    NormalizedRunner(runner_id="n1", name="A", saddle_cloth="1"),
+                    NormalizedRunner(runner_id="n2", name="B", saddle_cloth="2"),
+                ],
+            ),
+        ]
+        scalar = [self.scorer.score_race(race) for race in races]
+        batch = self.scorer.score_batch(races)
+        for s, b in zip(scalar, batch):
+            self.assertEqual(s.score, b.score)
+            self.assertEqual(s.reason, b.reason)
+            self.assertEqual(s.best_value_score, b.best_value_score)
+            self.assertEqual(s.best_value_reason, b.best_value_reason)
+
+
+if __name__ == "__main__":
+    unittest.main()